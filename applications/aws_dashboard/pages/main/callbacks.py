@@ -1,6 +1,7 @@
 """Callbacks/Connections for the Main/Front Dashboard Page"""
 
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dash import callback, Input, Output, State, html, no_update
 from dash.exceptions import PreventUpdate
 
@@ -66,13 +67,16 @@ def tables_refresh(main_page: MainPage, tables: dict[str, AGTable]):
         ],
     )
     def _all_tables_update(_n, current_hashes):
-        # Grab all tables and compute deltas
-        updated_dataframes = {
-            "data_sources": dataframe_delta(main_page.data_sources_summary, current_hashes["data_sources"]),
-            "feature_sets": dataframe_delta(main_page.feature_sets_summary, current_hashes["feature_sets"]),
-            "models": dataframe_delta(main_page.models_summary, current_hashes["models"]),
-            "endpoints": dataframe_delta(main_page.endpoints_summary, current_hashes["endpoints"]),
+        # Grab all tables and compute deltas (the summaries are I/O bound, so fetch them concurrently)
+        summaries = {
+            "data_sources": main_page.data_sources_summary,
+            "feature_sets": main_page.feature_sets_summary,
+            "models": main_page.models_summary,
+            "endpoints": main_page.endpoints_summary,
         }
+        with ThreadPoolExecutor(max_workers=len(summaries)) as executor:
+            futures = {key: executor.submit(dataframe_delta, fn, current_hashes[key]) for key, fn in summaries.items()}
+            updated_dataframes = {key: future.result() for key, future in futures.items()}
 
         # Check if all DataFrames are None (no changes)
         if all(df is None for df, _ in updated_dataframes.values()):
@@ -1,14 +1,14 @@
 """Callbacks for the Model Subpage Web User Interface"""
 
 import logging
-from dash import callback, no_update, Input, Output, State
+from dash import callback, ctx, no_update, Input, Output, State
 from dash.exceptions import PreventUpdate
 from urllib.parse import urlparse, parse_qs
 
 
 # Workbench Imports
 from workbench.web_interface.page_views.models_page_view import ModelsPageView
-from workbench.web_interface.components import model_plot
+from workbench.web_interface.components.model_plot import ModelPlot
 from workbench.web_interface.components.plugins.ag_table import AGTable
 from workbench.cached.cached_model import CachedModel
 
@@ -49,20 +49,30 @@ def on_page_load():
 
 def model_table_refresh(page_view: ModelsPageView, table: AGTable):
     @callback(
-        [Output(component_id, prop) for component_id, prop in table.properties],
+        [Output(component_id, prop) for component_id, prop in table.properties]
+        + [Output("models_details_poll", "disabled")],
         Input("models_refresh", "n_intervals"),
+        Input("models_details_poll", "n_intervals"),
     )
-    def _model_table_refresh(_n):
+    def _model_table_refresh(_n, _poll):
         """Return the table data for the Models Table"""
-        page_view.refresh()
+
+        # The details poll only pushes the table once (when the background details load finishes), otherwise
+        # re-sending the same summary rows would reset the grid (and the user's row selection) every poll tick
+        details_ready = page_view.details_ready.is_set()
+        if ctx.triggered_id == "models_details_poll":
+            if not details_ready:
+                return [no_update] * len(table.properties) + [False]
+        elif details_ready:
+            page_view.refresh()
         models = page_view.models()
         models["uuid"] = models["Model Group"]
         models["id"] = range(len(models))
-        return table.update_properties(models)
+        return table.update_properties(models) + [details_ready]
 
 
 # Updates the model plot when the model inference run dropdown is changed
-def update_model_plot_component():
+def update_model_plot_component(model_plot: ModelPlot):
     @callback(
         Output("model_plot", "figure"),
         Input("model_details-dropdown", "value"),
@@ -80,7 +90,7 @@ def update_model_plot_component():
         m = CachedModel(model_uuid)
 
         # Model Details Markdown component
-        model_plot_fig = model_plot.ModelPlot().update_properties(m, inference_run)
+        model_plot_fig = model_plot.update_properties(m, inference_run)
 
         # Return the details/markdown for these data details
         return model_plot_fig
@@ -16,6 +16,7 @@ def models_layout(
     layout = html.Div(
         children=[
             dcc.Interval(id="models_refresh", interval=60000),
+            dcc.Interval(id="models_details_poll", interval=2000, max_intervals=60),
             dcc.Store(id="models_page_loaded", data=False),
             dbc.Row(
                 [
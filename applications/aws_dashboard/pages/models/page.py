@@ -29,7 +29,8 @@ model_details = model_details.ModelDetails()
 model_details_component = model_details.create_component("model_details")
 
 # Create a Model Plot component to display the model metrics
-model_plot_component = model_plot.ModelPlot().create_component("model_plot")
+model_plot = model_plot.ModelPlot()
+model_plot_component = model_plot.create_component("model_plot")
 
 # Capture our components in a dictionary to send off to the layout
 components = {
@@ -63,7 +64,7 @@ callbacks.on_page_load()
 callbacks.model_table_refresh(model_view, models_table)
 
 # Callback for the model table
-callbacks.update_model_plot_component()
+callbacks.update_model_plot_component(model_plot)
 
 # Set up callbacks for all the plugins
 if plugins:
@@ -27,6 +27,11 @@ class FeatureSpaceProximity:
         self.target = target
         self.knn_neighbors = neighbors
 
+        # Precompute ID lookups (row position -> ID and ID -> target) for the neighbor queries
+        # Note: reversed so the first row wins for duplicate IDs
+        self._ids = df[id_column].tolist()
+        self._id_to_target = dict(zip(self._ids[::-1], df[target].tolist()[::-1])) if target else {}
+
         # Standardize the feature values and build the KNN model
         self.log.info("Building KNN model for FeatureSpaceProximity...")
         self.scaler = StandardScaler().fit(df[features])
@@ -125,12 +130,9 @@ class FeatureSpaceProximity:
 
         # Collect neighbor information (IDs, target values, and distances)
         query_ids = query_df[self.id_column].values
-        neighbor_ids = [[self.df.iloc[idx][self.id_column] for idx in index_list] for index_list in indices]
+        neighbor_ids = [[self._ids[idx] for idx in index_list] for index_list in indices]
         neighbor_targets = (
-            [
-                [self.df.loc[self.df[self.id_column] == neighbor, self.target].values[0] for neighbor in index_list]
-                for index_list in neighbor_ids
-            ]
+            [[self._id_to_target[neighbor] for neighbor in index_list] for index_list in neighbor_ids]
             if self.target
             else None
         )
@@ -149,10 +151,7 @@ class FeatureSpaceProximity:
             sorted_neighbors = sorted(zip(neighbor_ids[i], neighbor_distances[i]), key=lambda x: x[1])
             neighbor_ids[i], neighbor_distances[i] = list(zip(*sorted_neighbors)) if sorted_neighbors else ([], [])
             if neighbor_targets:
-                neighbor_targets[i] = [
-                    self.df.loc[self.df[self.id_column] == neighbor, self.target].values[0]
-                    for neighbor in neighbor_ids[i]
-                ]
+                neighbor_targets[i] = [self._id_to_target[neighbor] for neighbor in neighbor_ids[i]]
 
         # Create and return a results DataFrame with the updated neighbor information
         result_df = pd.DataFrame(
@@ -1,15 +1,27 @@
 """ParameterStore: Manages Workbench parameters in AWS Systems Manager Parameter Store."""
 
 from typing import Union
+import os
 import logging
 import json
 import zlib
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError
 
 # Workbench Imports
 from workbench.core.cloud_platform.aws.aws_session import AWSSession
 
+# Max number of names per SSM GetParameters call
+_GET_PARAMETERS_MAX = 10
+
+# Values larger than this (uncompressed) are rejected without trying to compress them (default: 1MB)
+_MAX_UNCOMPRESSED = int(os.environ.get("WORKBENCH_PARAM_MAX_BYTES", 1 << 20))
+
+# Where to point users for data that won't fit in the Parameter Store
+_DF_STORE_DOCS = "https://supercowpowers.github.io/workbench/api_classes/df_store"
+
 
 class ParameterStore:
     """ParameterStore: Manages Workbench parameters in AWS Systems Manager Parameter Store.
@@ -45,6 +57,10 @@ class ParameterStore:
         ```
     """
 
+    # The SSM client is shared across instances (created once per boto3 session)
+    _ssm_clients = {}
+    _ssm_lock = threading.Lock()
+
     def __init__(self):
         """ParameterStore Init Method"""
         self.log = logging.getLogger("workbench")
@@ -52,8 +68,24 @@ class ParameterStore:
         # Initialize a Workbench Session (to assume the Workbench ExecutionRole)
         self.boto3_session = AWSSession().boto3_session
 
-        # Create a Systems Manager (SSM) client for Parameter Store operations
-        self.ssm_client = self.boto3_session.client("ssm")
+        # Get the Systems Manager (SSM) client for Parameter Store operations
+        self.ssm_client = self._shared_ssm_client(self.boto3_session)
+
+    @classmethod
+    def _shared_ssm_client(cls, boto3_session):
+        """Internal: Get the shared SSM client for this boto3 session (creating it if needed)
+
+        Args:
+            boto3_session: The boto3 session to create the client from
+
+        Returns:
+            The SSM client for this boto3 session
+        """
+        with cls._ssm_lock:
+            client = cls._ssm_clients.get(boto3_session)
+            if client is None:
+                client = cls._ssm_clients[boto3_session] = boto3_session.client("ssm")
+            return client
 
     def list(self, prefix: str = None) -> list:
         """List all parameters in the AWS Parameter Store, optionally filtering by a prefix.
@@ -111,22 +143,7 @@ class ParameterStore:
         try:
             # Retrieve the parameter from Parameter Store
             response = self.ssm_client.get_parameter(Name=name, WithDecryption=decrypt)
-            value = response["Parameter"]["Value"]
-
-            # Auto-detect and decompress if needed
-            if value.startswith("COMPRESSED:"):
-                # Base64 decode and decompress
-                self.log.important(f"Decompressing parameter '{name}'...")
-                compressed_value = base64.b64decode(value[len("COMPRESSED:") :])
-                value = zlib.decompress(compressed_value).decode("utf-8")
-
-            # Attempt to parse the value back to its original type
-            try:
-                parsed_value = json.loads(value)
-                return parsed_value
-            except (json.JSONDecodeError, TypeError):
-                # If parsing fails, return the value as is (assumed to be a simple string)
-                return value
+            return self._decode_value(name, response["Parameter"]["Value"])
 
         except ClientError as e:
             if e.response["Error"]["Code"] == "ParameterNotFound":
@@ -136,6 +153,62 @@ class ParameterStore:
                 self.log.error(f"Failed to get parameter '{name}': {e}")
             return None
 
+    def get_many(self, names: list[str], decrypt: bool = True) -> dict:
+        """Retrieve multiple parameter values from the AWS Parameter Store (batched GetParameters calls)
+
+        Args:
+            names (list[str]): The names of the parameters to retrieve.
+            decrypt (bool): Whether to decrypt secure string parameters.
+
+        Returns:
+            dict: A dictionary of {name: value} in the order of names (parameters not found are left out)
+        """
+        # GetParameters takes up to 10 names per call
+        chunks = [names[i : i + _GET_PARAMETERS_MAX] for i in range(0, len(names), _GET_PARAMETERS_MAX)]
+        if not chunks:
+            return {}
+
+        def _get_chunk(chunk: list[str]) -> list[dict]:
+            response = self.ssm_client.get_parameters(Names=chunk, WithDecryption=decrypt)
+            if response.get("InvalidParameters"):
+                self.log.warning(f"Parameters not found: {response['InvalidParameters']}")
+            return response["Parameters"]
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+                parameters = [param for params in executor.map(_get_chunk, chunks) for param in params]
+        except ClientError as e:
+            self.log.error(f"Failed to get parameters: {e}")
+            return {}
+
+        # Return the values in the same order as the names
+        values = {param["Name"]: param["Value"] for param in parameters}
+        return {name: self._decode_value(name, values[name]) for name in names if name in values}
+
+    def _decode_value(self, name: str, value: str) -> Union[str, list, dict]:
+        """Internal: Decompress (if needed) and parse a stored parameter value back to its original type
+
+        Args:
+            name (str): The name of the parameter (for logging)
+            value (str): The stored parameter value
+
+        Returns:
+            Union[str, list, dict]: The parsed value
+        """
+        # Auto-detect and decompress if needed
+        if value.startswith("COMPRESSED:"):
+            # Base64 decode and decompress
+            self.log.important(f"Decompressing parameter '{name}'...")
+            compressed_value = base64.b64decode(value[len("COMPRESSED:") :])
+            value = zlib.decompress(compressed_value).decode("utf-8")
+
+        # Attempt to parse the value back to its original type
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            # If parsing fails, return the value as is (assumed to be a simple string)
+            return value
+
     def upsert(self, name: str, value, overwrite: bool = True):
         """Insert or update a parameter in the AWS Parameter Store.
 
@@ -146,22 +219,28 @@ class ParameterStore:
         """
         try:
 
-            # Anything that's not a string gets converted to JSON
+            # Anything that's not a string gets converted to (compact) JSON
             if not isinstance(value, str):
-                value = json.dumps(value)
+                value = json.dumps(value, separators=(",", ":"))
+
+            # Check size (SSM limits the value to 4KB, so measure the UTF-8 bytes) and compress if necessary
+            value_bytes = value.encode("utf-8")
+            if len(value_bytes) > 4096:
+                self.log.warning(f"Parameter {name} exceeds 4KB ({len(value_bytes)} Bytes)  Compressing...")
 
-            # Check size and compress if necessary
-            if len(value) > 4096:
-                self.log.warning(f"Parameter {name} exceeds 4KB ({len(value)} Bytes)  Compressing...")
-                compressed_value = zlib.compress(value.encode("utf-8"), level=9)
+                # Fail fast (skip the full compression pass) for data that's way too big
+                if len(value_bytes) > _MAX_UNCOMPRESSED:
+                    self.log.error(f"Parameter {name} is too large to compress under 4KB ({len(value_bytes)} Bytes)")
+                    self.log.error(f"For larger data use the DFStore() class ({_DF_STORE_DOCS})")
+                    return
+                compressed_value = zlib.compress(value_bytes, level=9)
                 encoded_value = "COMPRESSED:" + base64.b64encode(compressed_value).decode("utf-8")
 
-                # Report on the size of the compressed value
-                compressed_size = len(compressed_value)
+                # Report on the size of the compressed value (what's stored is the prefixed base64 string)
+                compressed_size = len(encoded_value)
                 if compressed_size > 4096:
-                    doc_link = "https://supercowpowers.github.io/workbench/api_classes/df_store"
                     self.log.error(f"Compressed size {compressed_size} bytes, cannot store > 4KB")
-                    self.log.error(f"For larger data use the DFStore() class ({doc_link})")
+                    self.log.error(f"For larger data use the DFStore() class ({_DF_STORE_DOCS})")
                     return
 
                 # Insert or update the compressed parameter in Parameter Store
@@ -228,6 +307,10 @@ if __name__ == "__main__":
     print("Listing Parameters...")
     print(param_store.list())
 
+    # Get multiple parameters at once
+    print("Getting multiple parameters:")
+    print(param_store.get_many(["/workbench/test", "/workbench/my_data"]))
+
     # List the parameters with a prefix
     print("Listing Parameters with prefix '/workbench':")
     print(param_store.list("/workbench"))
@@ -1,6 +1,7 @@
 """CachedModel: Caches the method results for Workbench Models"""
 
 from typing import Union
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 
 # Workbench Imports
@@ -92,6 +93,32 @@ class CachedModel(CachedArtifactMixin, ModelCore):
         """
         return super().get_inference_metrics(capture_uuid=capture_uuid)
 
+    @CachedArtifactMixin.cache_result
+    def get_inference_metadata(self, capture_uuid: str = "auto_inference") -> Union[pd.DataFrame, None]:
+        """Retrieve the inference metadata for this model
+
+        Args:
+            capture_uuid (str, optional): Specific capture_uuid (default: auto_inference)
+
+        Returns:
+            pd.DataFrame: DataFrame of the Inference Metadata (might be None)
+        """
+        return super().get_inference_metadata(capture_uuid=capture_uuid)
+
+    def get_inference_bundle(self, capture_uuid: str = "auto_inference") -> tuple:
+        """Retrieve both the inference metadata and the inference metrics (fetched concurrently)
+
+        Args:
+            capture_uuid (str, optional): Specific capture_uuid (default: auto_inference)
+
+        Returns:
+            tuple: (inference metadata DataFrame, inference metrics DataFrame), either might be None
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            meta_future = executor.submit(self.get_inference_metadata, capture_uuid=capture_uuid)
+            metrics_future = executor.submit(self.get_inference_metrics, capture_uuid=capture_uuid)
+            return meta_future.result(), metrics_future.result()
+
     @CachedArtifactMixin.cache_result
     def get_inference_predictions(self, capture_uuid: str = "auto_inference") -> Union[pd.DataFrame, None]:
         """Retrieve the captured prediction results for this model
@@ -133,6 +160,7 @@ if __name__ == "__main__":
     pprint(my_model.health_check())
     pprint(my_model.list_inference_runs())
     print(my_model.get_inference_metrics())
+    print(my_model.get_inference_metadata())
     print(my_model.get_inference_predictions())
 
     # Shutdown the ThreadPoolExecutor (note: users should NOT call this)
@@ -2,6 +2,7 @@
                 Artifacts simply reflect and aggregate one or more AWS Services"""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 from typing import Union
@@ -85,6 +86,19 @@ class Artifact(ABC):
         else:
             self.log.info(f"Health Check Passed {self.uuid}")
 
+    @classmethod
+    def managed_delete_many(cls, names: list[str], max_workers: int = 8):
+        """Delete several artifacts of this type concurrently (each delete is a handful of I/O bound AWS calls)
+
+        Args:
+            names (list[str]): The names of the artifacts to delete
+            max_workers (int): The maximum number of concurrent deletes (default: 8)
+        """
+        if not names:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+            list(executor.map(cls.managed_delete, names))
+
     @classmethod
     def is_name_valid(cls, name: str, delimiter: str = "_", lower_case: bool = True) -> bool:
         """Check if the name adheres to the naming conventions for this Artifact.
@@ -210,22 +210,28 @@ class AthenaSource(DataSourceAbstract):
         return self.database_query(self.database, query)
 
     @classmethod
-    def database_query(cls, database: str, query: str) -> Union[pd.DataFrame, None]:
+    def database_query(cls, database: str, query: str, unload: bool = False) -> Union[pd.DataFrame, None]:
         """Specify the Database and Query the Athena Service
 
         Args:
             database (str): The Athena Database to query
             query (str): The query to run against the AthenaSource
+            unload (bool): Use an Athena UNLOAD (Parquet) for the results instead of CSV (default: False)
 
         Returns:
             pd.DataFrame: The results of the query
         """
         cls.log.debug(f"Executing Query: {query}...")
         try:
+            # UNLOAD writes typed Parquet results which are read in parallel (no CSV text parsing),
+            # this is a win for larger result sets but adds some S3 overhead for small queries.
+            # The UNLOAD Parquet files are deleted after they're read
             df = wr.athena.read_sql_query(
                 sql=query,
                 database=database,
                 ctas_approach=False,
+                unload_approach=unload,
+                keep_files=not unload,
                 boto3_session=cls.boto3_session,
             )
             scanned_bytes = df.query_metadata["Statistics"]["DataScannedInBytes"]
@@ -372,8 +378,9 @@ class AthenaSource(DataSourceAbstract):
         sample_rows = self.sample()
         sample_rows["outlier_group"] = "sample"
 
-        # Combine the sample rows with the outlier rows
-        all_rows = pd.concat([outlier_rows, sample_rows]).reset_index(drop=True)
+        # Combine the sample rows with the outlier rows (single concat with a fresh index, skipping empty frames)
+        non_empty = [df for df in (outlier_rows, sample_rows) if not df.empty]
+        all_rows = pd.concat(non_empty, ignore_index=True) if non_empty else sample_rows
 
         # Drop duplicates
         all_except_outlier_group = [col for col in all_rows.columns if col != "outlier_group"]
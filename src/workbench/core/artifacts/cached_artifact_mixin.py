@@ -4,6 +4,7 @@ import logging
 import time
 from functools import wraps
 from concurrent.futures import ThreadPoolExecutor
+from workbench import __version__
 from workbench.utils.workbench_cache import WorkbenchCache
 
 
@@ -29,9 +30,11 @@ class CachedArtifactMixin:
 
         @wraps(method)
         def wrapper(self, *args, **kwargs):
-            # Cache key includes the class name, instance UUID, and method args/kwargs
+            # Cache key includes the Workbench version, class name, instance UUID, and method args/kwargs
+            #   Note: The version means a (shared/persistent) cache never serves results from an older release
             class_name = self.__class__.__name__.lower()
-            cache_key = f"{class_name}_{self.uuid}_{cls._flatten_redis_key(method, *args, **kwargs)}"
+            method_key = cls._flatten_redis_key(method, *args, **kwargs)
+            cache_key = f"{__version__}_{class_name}_{self.uuid}_{method_key}"
 
             # Get the cached value and check if a refresh is needed
             cached_value = cls.artifact_cache.get(cache_key)
@@ -577,6 +577,15 @@ class EndpointCore(Artifact):
             "description": description,
         }
 
+        # REGRESSORS: Store the actual/prediction ranges (so plots don't have to scan the predictions)
+        prediction_col = "prediction" if "prediction" in pred_results_df.columns else "predictions"
+        has_columns = {target_column, prediction_col}.issubset(pred_results_df.columns)
+        if model_type in [ModelType.REGRESSOR, ModelType.QUANTILE_REGRESSOR] and has_columns:
+            inference_meta["actual_min"] = float(pred_results_df[target_column].min())
+            inference_meta["actual_max"] = float(pred_results_df[target_column].max())
+            inference_meta["pred_min"] = float(pred_results_df[prediction_col].min())
+            inference_meta["pred_max"] = float(pred_results_df[prediction_col].max())
+
         # Create the S3 Path for the Inference Capture
         inference_capture_path = f"{self.endpoint_inference_path}/{capture_uuid}"
 
@@ -590,7 +599,6 @@ class EndpointCore(Artifact):
         wr.s3.to_csv(metrics, f"{inference_capture_path}/inference_metrics.csv", index=False)
 
         # Grab the target column, prediction column, any _proba columns, and the ID column (if present)
-        prediction_col = "prediction" if "prediction" in pred_results_df.columns else "predictions"
         output_columns = [target_column, prediction_col]
 
         # Add any _proba columns to the output columns
@@ -1,5 +1,6 @@
 import os
 import json
+import pickle
 from datetime import datetime
 from pathlib import Path
 
@@ -14,6 +15,25 @@ except ImportError:
 from workbench.core.artifacts.artifact import Artifact
 from workbench.utils.json_utils import CustomEncoder
 
+# Local (pickled) copies of graphs pulled from S3, keyed by the graph uuid and the S3 ETag
+# Note: This is a per-user directory (0o700) since we unpickle these files
+_GRAPH_CACHE_DIR = Path.home() / ".workbench" / "cache" / "graphs"
+
+
+def _is_private(path: Path) -> bool:
+    """Internal: Check that a cache path is owned by the current user and not writable by anyone else
+
+    Args:
+        path (Path): The file or directory to check
+
+    Returns:
+        bool: True if the path is safe to trust (always True on platforms without POSIX ownership)
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    stat = os.lstat(path)
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022 and not os.path.islink(path)
+
 
 class GraphCore(Artifact):
     """GraphCore: A class to handle graph artifacts in Workbench"""
@@ -77,7 +97,8 @@ class GraphCore(Artifact):
     def exists(self) -> bool:
         """Check if the graph exists in S3"""
         try:
-            self.s3_client.head_object(Bucket=self.workbench_bucket, Key=f"graphs/{self.uuid}.json")
+            response = self.s3_client.head_object(Bucket=self.workbench_bucket, Key=f"graphs/{self.uuid}.json")
+            self._etag = response["ETag"].strip('"')
             return True
         except self.s3_client.exceptions.ClientError:
             return False
@@ -209,13 +230,58 @@ class GraphCore(Artifact):
             bucket = self.workbench_bucket
             key = f"graphs/{self.uuid}.json"
 
+        # If the graph in S3 hasn't changed (same ETag) we can use our local pickled copy
+        etag = None if s3_path else getattr(self, "_etag", None)
+        cache_path = _GRAPH_CACHE_DIR / f"{self.uuid}_{etag}.pkl" if etag else None
+        if cache_path and cache_path.exists():
+            try:
+                if _is_private(_GRAPH_CACHE_DIR) and _is_private(cache_path):
+                    with open(cache_path, "rb") as file:
+                        self.graph = pickle.load(file)
+                    return self.graph
+                self.log.warning(f"Ignoring local graph cache {cache_path}: not private to the current user")
+            except Exception as e:
+                self.log.warning(f"Could not read local graph cache {cache_path}: {e}")
+
         # Load the graph from S3
         response = self.s3_client.get_object(Bucket=bucket, Key=key)
         graph_str = response["Body"].read().decode("utf-8")
         graph_json = json.loads(graph_str)
         self.graph = nx.readwrite.json_graph.node_link_graph(graph_json)
+
+        # Write the local pickled copy
+        if cache_path:
+            self._write_graph_cache(cache_path)
         return self.graph
 
+    def _write_graph_cache(self, cache_path: Path):
+        """Internal: Write the local pickled copy of the graph and remove copies for older ETags
+
+        Args:
+            cache_path (Path): The cache file for the current ETag
+        """
+        try:
+            _GRAPH_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(_GRAPH_CACHE_DIR):
+                self.log.warning(
+                    f"Not writing local graph cache: {_GRAPH_CACHE_DIR} is not private to the current user"
+                )
+                return
+
+            # Atomic rename so readers never see a partial file
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as file:
+                pickle.dump(self.graph, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+
+            # Remove the copies for older ETags of this graph (ETags never contain an underscore)
+            prefix = f"{self.uuid}_"
+            for old_path in _GRAPH_CACHE_DIR.glob(f"{prefix}*.pkl"):
+                if old_path != cache_path and "_" not in old_path.name[len(prefix) : -len(".pkl")]:
+                    old_path.unlink(missing_ok=True)
+        except OSError as e:
+            self.log.warning(f"Could not write local graph cache {cache_path}: {e}")
+
     def _load_graph_from_file(self, file_path: str):
         """Helper method to load the graph from a file path"""
         try:
@@ -12,6 +12,10 @@ from workbench.core.cloud_platform.aws.aws_account_clamp import AWSAccountClamp
 from workbench.utils.config_manager import ConfigManager
 from workbench.utils.aws_utils import not_found_returns_none
 
+# Column layout (and empty prototype) for the details() DataFrame
+_DETAILS_COLS = ("location", "s3_file", "size", "modified")
+_EMPTY_DETAILS = pd.DataFrame({c: pd.Series(dtype="object") for c in _DETAILS_COLS})
+
 
 class AWSDFStore:
     """AWSDFStore: Fast/efficient storage of DataFrames using AWS S3/Parquet/Snappy
@@ -112,33 +116,29 @@ class AWSDFStore:
         try:
             response = self.s3_client.list_objects_v2(Bucket=self.workbench_bucket, Prefix=self.path_prefix)
             if "Contents" not in response:
-                return pd.DataFrame(columns=["location", "s3_file", "size", "modified"])
+                return _EMPTY_DETAILS.copy()
 
-            # Collect details for each object
-            data = []
+            # Collect details for each object, column-wise (skipping cache objects unless requested)
+            cache_prefix = "/workbench/dataframe_cache/"
+            details = {c: [] for c in _DETAILS_COLS}
             for obj in response["Contents"]:
                 full_key = obj["Key"]
 
                 # Reverse logic: Strip the bucket/prefix in the front and .parquet in the end
                 location = full_key.replace(f"{self.path_prefix}", "/").split(".parquet")[0]
-                s3_file = f"s3://{self.workbench_bucket}/{full_key}"
-                size = obj["Size"]
-                modified = obj["LastModified"]
-                data.append([location, s3_file, size, modified])
-
-            # Create the DataFrame
-            df = pd.DataFrame(data, columns=["location", "s3_file", "size", "modified"])
-
-            # Apply the exclude_prefix filter if set
-            cache_prefix = "/workbench/dataframe_cache/"
-            if not include_cache:
-                df = df[~df["location"].str.startswith(cache_prefix)]
+                if not include_cache and location.startswith(cache_prefix):
+                    continue
+                details["location"].append(location)
+                details["s3_file"].append(f"s3://{self.workbench_bucket}/{full_key}")
+                details["size"].append(obj["Size"])
+                details["modified"].append(obj["LastModified"])
 
-            return df
+            # Create and return the DataFrame
+            return pd.DataFrame(details, columns=_DETAILS_COLS)
 
         except Exception as e:
             self.log.error(f"Failed to get object details: {e}")
-            return pd.DataFrame(columns=["location", "s3_file", "size", "created", "modified"])
+            return _EMPTY_DETAILS.copy()
 
     def check(self, location: str) -> bool:
         """Check if a DataFrame exists at the specified location
@@ -247,25 +247,24 @@ class AWSDFStore:
 
     def __repr__(self):
         """Return a string representation of the AWSDFStore object."""
-        # Use the summary() method and format it to align columns for printing
-        summary_df = self.summary()
+        # Format the rows directly from details() (no intermediate summary DataFrame needed for printing)
+        df = self.details()
 
         # Sanity check: If there are no objects, return a message
-        if summary_df.empty:
+        if df is None or df.empty:
             return "AWSDFStore: No data objects found in the store."
 
-        # Dynamically compute the max length of the 'location' column and add 5 spaces for padding
-        max_location_len = summary_df["location"].str.len().max() + 2
-        summary_df["location"] = summary_df["location"].str.ljust(max_location_len)
-
-        # Format the size column to include (MB) and ensure 3 spaces between size and date
-        summary_df["size (MB)"] = summary_df["size (MB)"].apply(lambda x: f"{x:.2f} MB")
+        # Align the columns: pad the locations and right-justify the sizes (in MB)
+        locations = df["location"].tolist()
+        sizes = [f"{size / (1024 * 1024):.2f} MB" for size in df["size"].tolist()]
+        location_width = max(len(location) for location in locations) + 2
+        size_width = max(len(size) for size in sizes)
 
-        # Enclose the modified date in parentheses and ensure 3 spaces between size and date
-        summary_df["modified"] = summary_df["modified"].apply(lambda x: f" ({x})")
-
-        # Convert the DataFrame to a string, remove headers, and return
-        return summary_df.to_string(index=False, header=False)
+        # Enclose the modified date in parentheses and return one line per object
+        return "\n".join(
+            f"{location:<{location_width}} {size:>{size_width}}  ({modified:%Y-%m-%d %H:%M:%S})"
+            for location, size, modified in zip(locations, sizes, df["modified"])
+        )
 
 
 if __name__ == "__main__":
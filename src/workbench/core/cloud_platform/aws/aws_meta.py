@@ -8,14 +8,82 @@ from typing import Union
 import pandas as pd
 import awswrangler as wr
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from types import MappingProxyType
 
 # Workbench Imports
 from workbench.core.cloud_platform.aws.aws_account_clamp import AWSAccountClamp
 from workbench.utils.config_manager import ConfigManager
-from workbench.utils.datetime_utils import datetime_string
+from workbench.utils.datetime_utils import datetime_string, datetime_strings
 from workbench.utils.aws_utils import not_found_returns_none, aws_throttle, aws_tags_to_dict
 
+# Shared read-only empty defaults for nested metadata lookups (avoids a new {}/[] per row on the miss path)
+_EMPTY = MappingProxyType({})
+_EMPTY_LIST = ()
+
+# Column layouts for the summary DataFrames (built column-wise for speed)
+_INCOMING_COLS = ("Name", "Size", "Modified", "ContentType", "Encryption", "Tags", "_aws_url")
+_ETL_COLS = ("Name", "Workers", "WorkerType", "Start Time", "Duration", "State", "_aws_url")
+_CATALOG_COLS = ("Name", "Owner", "Database", "Modified", "Tags", "Columns", "Input", "_aws_url")
+_FEATURE_SET_COLS = (
+    "Feature Group",
+    "Health",
+    "Owner",
+    "Created",
+    "Num Columns",
+    "Input",
+    "Tags",
+    "Online",
+    "Offline",
+    "_aws_url",
+)
+_MODEL_COLS = (
+    "Model Group",
+    "Health",
+    "Owner",
+    "Model Type",
+    "Created",
+    "Ver",
+    "Tags",
+    "Input",
+    "Status",
+    "Description",
+    "_aws_url",
+)
+_ENDPOINT_COLS = (
+    "Name",
+    "Health",
+    "Instance",
+    "Created",
+    "Tags",
+    "Input",
+    "Status",
+    "Variant",
+    "Capture",
+    "Samp(%)",
+)
+_PIPELINE_COLS = ("Name", "Health", "Num Stages", "Tags", "Modified", "Last Run", "Status")
+_AWS_PIPELINE_COLS = ("Name", "ExecutionName", "Health", "Created", "Tags", "Input", "Status", "PipelineArn")
+
+# AWS Console URL templates for the Artifacts (filled in with %-formatting, one per row)
+_CONSOLE = "console.aws.amazon.com"
+_S3_CONSOLE_URL = f"https://s3.{_CONSOLE}/s3/object/%s?prefix=%s"
+_GLUE_JOB_CONSOLE_URL = f"https://%(region)s.{_CONSOLE}/gluestudio/home?region=%(region)s#/editor/job/%(name)s/runs"
+_DATA_CATALOG_CONSOLE_URL = (
+    f"https://%(region)s.{_CONSOLE}/athena/home?region=%(region)s#query/databases/%(database)s/tables/%(name)s"
+)
+_FEATURE_GROUP_CONSOLE_URL = (
+    f"https://%(region)s.{_CONSOLE}/sagemaker/home?region=%(region)s#/feature-groups/%(name)s/details"
+)
+_MODEL_GROUP_CONSOLE_URL = (
+    f"https://%(region)s.{_CONSOLE}/sagemaker/home?region=%(region)s#/model-registry/%(name)s/details"
+)
+_ENDPOINT_CONSOLE_URL = f"https://%(region)s.{_CONSOLE}/sagemaker/home?region=%(region)s#/endpoints/%(name)s/details"
+
+# Empty summary prototype (returned as a copy when there's no incoming data bucket)
+_EMPTY_INCOMING = pd.DataFrame({c: pd.Series(dtype="object") for c in _INCOMING_COLS})
+
 
 class AWSMeta:
     """AWSMeta: A class that provides Metadata for a broad set of AWS Platform Artifacts
@@ -32,22 +100,40 @@ class AWSMeta:
         self.account_clamp = AWSAccountClamp()
         self.cm = ConfigManager()
 
-        # Parameter Store for Pipelines
-        from workbench.api.parameter_store import ParameterStore
-
+        # Parameter Store for Pipelines (created on first use)
         self.pipeline_prefix = "/workbench/pipelines"
-        self.param_store = ParameterStore()
+        self._cached_param_store = None
 
         # Storing the size of various metadata for tracking
         self.metadata_sizes = defaultdict(dict)
 
+        # Max threads used for the per-artifact AWS calls (describe/tags) in the summary methods
+        self.max_workers = 8
+
         # Fill in AWS Specific Information
         self.workbench_bucket = self.cm.get_config("WORKBENCH_BUCKET")
         self.incoming_bucket = "s3://" + self.workbench_bucket + "/incoming-data/"
         self.boto3_session = self.account_clamp.boto3_session
         self.sm_client = self.account_clamp.sagemaker_client()
+        self._cached_glue_client = None
         self.sm_session = self.account_clamp.sagemaker_session()
 
+    @property
+    def param_store(self):
+        """Lazily create the ParameterStore (only needed for the pipeline methods)"""
+        if self._cached_param_store is None:
+            from workbench.api.parameter_store import ParameterStore
+
+            self._cached_param_store = ParameterStore()
+        return self._cached_param_store
+
+    @property
+    def glue_client(self):
+        """Lazily create the Glue client (only needed for the ETL job and data catalog methods)"""
+        if self._cached_glue_client is None:
+            self._cached_glue_client = self.boto3_session.client("glue")
+        return self._cached_glue_client
+
     def account(self) -> dict:
         """Cloud Platform Account Info
 
@@ -75,25 +161,21 @@ class AWSMeta:
 
         # Check if our bucket does not exist
         if s3_file_info is None:
-            return pd.DataFrame()
+            return _EMPTY_INCOMING.copy()
 
-        # Summarize the data into a DataFrame
-        data_summary = []
+        # Summarize the data into a DataFrame (column-wise)
+        summary = {c: [] for c in _INCOMING_COLS}
         for full_path, info in s3_file_info.items():
-            name = "/".join(full_path.split("/")[-2:]).replace("incoming-data/", "")
-            size_mb = f"{info.get('ContentLength', 0) / 1_000_000:.2f} MB"
-
-            summary = {
-                "Name": name,
-                "Size": size_mb,
-                "Modified": datetime_string(info.get("LastModified", "-")),
-                "ContentType": info.get("ContentType", "-"),
-                "Encryption": info.get("ServerSideEncryption", "-"),
-                "Tags": str(info.get("tags", "-")),  # Ensure 'tags' exist if needed
-                "_aws_url": self.s3_to_console_url(full_path),
-            }
-            data_summary.append(summary)
-        return pd.DataFrame(data_summary).convert_dtypes()
+            summary["Name"].append("/".join(full_path.split("/")[-2:]).replace("incoming-data/", ""))
+            summary["Size"].append(f"{info.get('ContentLength', 0) / 1_000_000:.2f} MB")
+            summary["Modified"].append(info.get("LastModified"))
+            summary["ContentType"].append(info.get("ContentType", "-"))
+            summary["Encryption"].append(info.get("ServerSideEncryption", "-"))
+            summary["Tags"].append(str(info.get("tags", "-")))  # Ensure 'tags' exist if needed
+            summary["_aws_url"].append(self.s3_to_console_url(full_path))
+        df = pd.DataFrame(summary, columns=_INCOMING_COLS)
+        df["Modified"] = datetime_strings(df["Modified"])
+        return df.convert_dtypes()
 
     def etl_jobs(self) -> pd.DataFrame:
         """Get summary data about Extract, Transform, Load (ETL) Jobs (AWS Glue Jobs)
@@ -103,29 +185,27 @@ class AWSMeta:
         """
 
         # Retrieve Glue job metadata
-        glue_client = self.boto3_session.client("glue")
-        response = glue_client.get_jobs()
+        response = self.glue_client.get_jobs()
         jobs = response["Jobs"]
 
-        # Extract relevant data for each job
-        job_summary = []
+        # Extract relevant data for each job (column-wise)
+        summary = {c: [] for c in _ETL_COLS}
         for job in jobs:
             job_name = job["Name"]
-            job_runs = glue_client.get_job_runs(JobName=job_name, MaxResults=1)["JobRuns"]
+            job_runs = self.glue_client.get_job_runs(JobName=job_name, MaxResults=1)["JobRuns"]
 
             last_run = job_runs[0] if job_runs else None
-            summary = {
-                "Name": job_name,
-                "Workers": job.get("NumberOfWorkers", "-"),
-                "WorkerType": job.get("WorkerType", "-"),
-                "Start Time": datetime_string(last_run["StartedOn"]) if last_run else "-",
-                "Duration": f"{last_run['ExecutionTime']} sec" if last_run else "-",
-                "State": last_run["JobRunState"] if last_run else "-",
-                "_aws_url": self.glue_job_console_url(job_name),
-            }
-            job_summary.append(summary)
-
-        return pd.DataFrame(job_summary).convert_dtypes()
+            summary["Name"].append(job_name)
+            summary["Workers"].append(job.get("NumberOfWorkers", "-"))
+            summary["WorkerType"].append(job.get("WorkerType", "-"))
+            summary["Start Time"].append(last_run["StartedOn"] if last_run else None)
+            summary["Duration"].append(f"{last_run['ExecutionTime']} sec" if last_run else "-")
+            summary["State"].append(last_run["JobRunState"] if last_run else "-")
+            summary["_aws_url"].append(self.glue_job_console_url(job_name))
+
+        df = pd.DataFrame(summary, columns=_ETL_COLS)
+        df["Start Time"] = datetime_strings(df["Start Time"])
+        return df.convert_dtypes()
 
     def data_sources(self) -> pd.DataFrame:
         """Get a summary of the Data Sources deployed in the AWS Platform
@@ -167,36 +247,36 @@ class AWSMeta:
         """
         # Initialize the SageMaker paginator for listing feature groups
         paginator = self.sm_client.get_paginator("list_feature_groups")
-        data_summary = []
+        summary = {c: [] for c in _FEATURE_SET_COLS}
 
         # Use the paginator to retrieve all feature groups
-        for page in paginator.paginate():
-            for fg in page["FeatureGroupSummaries"]:
-                name = fg["FeatureGroupName"]
-
-                # Get details if requested
-                feature_set_details = {}
-                if details:
-                    feature_set_details.update(self.sm_client.describe_feature_group(FeatureGroupName=name))
-
-                # Retrieve Workbench metadata from tags
-                aws_tags = self.get_aws_tags(fg["FeatureGroupArn"])
-                summary = {
-                    "Feature Group": name,
-                    "Health": "",
-                    "Owner": aws_tags.get("workbench_owner", "-"),
-                    "Created": datetime_string(feature_set_details.get("CreationTime")),
-                    "Num Columns": len(feature_set_details.get("FeatureDefinitions", [])),
-                    "Input": aws_tags.get("workbench_input", "-"),
-                    "Tags": aws_tags.get("workbench_tags", "-"),
-                    "Online": str(feature_set_details.get("OnlineStoreConfig", {}).get("EnableOnlineStore", "Unknown")),
-                    "Offline": "True" if feature_set_details.get("OfflineStoreConfig") else "Unknown",
-                    "_aws_url": self.feature_group_console_url(name),
-                }
-                data_summary.append(summary)
+        feature_groups = [fg for page in paginator.paginate() for fg in page["FeatureGroupSummaries"]]
+        names = [fg["FeatureGroupName"] for fg in feature_groups]
+
+        # Get details (if requested) and Workbench metadata (tags) concurrently
+        if details:
+            all_details = self._parallel_map(lambda n: self.sm_client.describe_feature_group(FeatureGroupName=n), names)
+        else:
+            all_details = [{} for _ in names]
+        all_tags = self._parallel_map(self.get_aws_tags, [fg["FeatureGroupArn"] for fg in feature_groups])
+
+        for name, feature_set_details, aws_tags in zip(names, all_details, all_tags):
+            online = feature_set_details.get("OnlineStoreConfig", _EMPTY).get("EnableOnlineStore", "Unknown")
+            summary["Feature Group"].append(name)
+            summary["Health"].append("")
+            summary["Owner"].append(aws_tags.get("workbench_owner", "-"))
+            summary["Created"].append(feature_set_details.get("CreationTime"))
+            summary["Num Columns"].append(len(feature_set_details.get("FeatureDefinitions", _EMPTY_LIST)))
+            summary["Input"].append(aws_tags.get("workbench_input", "-"))
+            summary["Tags"].append(aws_tags.get("workbench_tags", "-"))
+            summary["Online"].append(str(online))
+            summary["Offline"].append("True" if feature_set_details.get("OfflineStoreConfig") else "Unknown")
+            summary["_aws_url"].append(self.feature_group_console_url(name))
 
         # Return the summary as a DataFrame
-        return pd.DataFrame(data_summary).convert_dtypes()
+        df = pd.DataFrame(summary, columns=_FEATURE_SET_COLS)
+        df["Created"] = datetime_strings(df["Created"])
+        return df.convert_dtypes()
 
     def models(self, details: bool = False) -> pd.DataFrame:
         """Get a summary of the Models in AWS.
@@ -209,53 +289,55 @@ class AWSMeta:
         """
         # Initialize the SageMaker paginator for listing model package groups
         paginator = self.sm_client.get_paginator("list_model_package_groups")
-        model_summary = []
+        summary = {c: [] for c in _MODEL_COLS}
 
         # Use the paginator to retrieve all model package groups
-        for page in paginator.paginate():
-            for group in page["ModelPackageGroupSummaryList"]:
-                model_group_name = group["ModelPackageGroupName"]
-                created = datetime_string(group["CreationTime"])
-                description = group.get("ModelPackageGroupDescription", "-")
-
-                # Initialize variables for details retrieval
-                model_details = {}
-                aws_tags = {}
-                status = "Unknown"
-                health_tags = ""
-
-                # If details=True get the latest model package details
-                if details:
-                    latest_model = self.get_latest_model_package_info(model_group_name)
-                    if latest_model:
-                        model_details.update(
-                            self.sm_client.describe_model_package(ModelPackageName=latest_model["ModelPackageArn"])
-                        )
-                        aws_tags = self.get_aws_tags(group["ModelPackageGroupArn"])
-                        health_tags = aws_tags.get("workbench_health_tags", "")
-                        status = model_details.get("ModelPackageStatus", "Unknown")
-                    else:
-                        health_tags = "model_not_found"
-                        status = "No Models"
-
-                # Compile model summary
-                summary = {
-                    "Model Group": model_group_name,
-                    "Health": health_tags,
-                    "Owner": aws_tags.get("workbench_owner", "-"),
-                    "Model Type": aws_tags.get("workbench_model_type", "-"),
-                    "Created": created,
-                    "Ver": model_details.get("ModelPackageVersion", "-"),
-                    "Tags": aws_tags.get("workbench_tags", "-"),
-                    "Input": aws_tags.get("workbench_input", "-"),
-                    "Status": status,
-                    "Description": description,
-                    "_aws_url": self.model_package_group_console_url(model_group_name),
-                }
-                model_summary.append(summary)
+        groups = [group for page in paginator.paginate() for group in page["ModelPackageGroupSummaryList"]]
+
+        # If details=True get the latest model package details for each group (concurrently)
+        if details:
+            all_details = self._parallel_map(self._model_group_details, groups)
+        else:
+            all_details = [({}, {}, "Unknown", "") for _ in groups]
+
+        for group, (model_details, aws_tags, status, health_tags) in zip(groups, all_details):
+            model_group_name = group["ModelPackageGroupName"]
+
+            # Compile model summary
+            summary["Model Group"].append(model_group_name)
+            summary["Health"].append(health_tags)
+            summary["Owner"].append(aws_tags.get("workbench_owner", "-"))
+            summary["Model Type"].append(aws_tags.get("workbench_model_type", "-"))
+            summary["Created"].append(group["CreationTime"])
+            summary["Ver"].append(model_details.get("ModelPackageVersion", "-"))
+            summary["Tags"].append(aws_tags.get("workbench_tags", "-"))
+            summary["Input"].append(aws_tags.get("workbench_input", "-"))
+            summary["Status"].append(status)
+            summary["Description"].append(group.get("ModelPackageGroupDescription", "-"))
+            summary["_aws_url"].append(self.model_package_group_console_url(model_group_name))
 
         # Return the summary as a DataFrame
-        return pd.DataFrame(model_summary).convert_dtypes()
+        df = pd.DataFrame(summary, columns=_MODEL_COLS)
+        df["Created"] = datetime_strings(df["Created"])
+        return df.convert_dtypes()
+
+    def _model_group_details(self, group: dict) -> tuple:
+        """Internal: Get the latest model package details and the Workbench metadata for a model group
+
+        Args:
+            group (dict): The model package group summary (from list_model_package_groups)
+
+        Returns:
+            tuple: (model package details, aws tags, status, health tags)
+        """
+        latest_model = self.get_latest_model_package_info(group["ModelPackageGroupName"])
+        if not latest_model:
+            return {}, {}, "No Models", "model_not_found"
+        model_details = self.sm_client.describe_model_package(ModelPackageName=latest_model["ModelPackageArn"])
+        aws_tags = self.get_aws_tags(group["ModelPackageGroupArn"])
+        health_tags = aws_tags.get("workbench_health_tags", "")
+        status = model_details.get("ModelPackageStatus", "Unknown")
+        return model_details, aws_tags, status, health_tags
 
     def endpoints(self, refresh: bool = False) -> pd.DataFrame:
         """Get a summary of the Endpoints in AWS.
@@ -266,51 +348,52 @@ class AWSMeta:
         Returns:
             pd.DataFrame: A summary of the Endpoints in AWS.
         """
-        # Initialize the SageMaker client and list all endpoints
-        sagemaker_client = self.boto3_session.client("sagemaker")
-        paginator = sagemaker_client.get_paginator("list_endpoints")
-        data_summary = []
+        # Use the SageMaker client to list all endpoints
+        paginator = self.sm_client.get_paginator("list_endpoints")
+        summary = {c: [] for c in _ENDPOINT_COLS}
 
         # Use the paginator to retrieve all endpoints
-        for page in paginator.paginate():
-            for endpoint in page["Endpoints"]:
-                endpoint_name = endpoint["EndpointName"]
-                endpoint_info = sagemaker_client.describe_endpoint(EndpointName=endpoint_name)
-
-                # Retrieve Workbench metadata from tags
-                workbench_meta = self.get_aws_tags(endpoint_info["EndpointArn"])
-                health_tags = workbench_meta.get("workbench_health_tags", "")
-
-                # Retrieve endpoint configuration to determine instance type or serverless info
-                endpoint_config_name = endpoint_info["EndpointConfigName"]
-                endpoint_config = sagemaker_client.describe_endpoint_config(EndpointConfigName=endpoint_config_name)
-                production_variant = endpoint_config["ProductionVariants"][0]
-
-                # Determine instance type or serverless configuration
-                instance_type = production_variant.get("InstanceType")
-                if instance_type is None:
-                    # If no instance type, it's a serverless configuration
-                    mem_size = production_variant["ServerlessConfig"]["MemorySizeInMB"]
-                    concurrency = production_variant["ServerlessConfig"]["MaxConcurrency"]
-                    instance_type = f"Serverless ({mem_size//1024}GB/{concurrency})"
-
-                # Compile endpoint summary
-                summary = {
-                    "Name": endpoint_name,
-                    "Health": health_tags,
-                    "Instance": instance_type,
-                    "Created": datetime_string(endpoint_info.get("CreationTime")),
-                    "Tags": workbench_meta.get("workbench_tags", "-"),
-                    "Input": workbench_meta.get("workbench_input", "-"),
-                    "Status": endpoint_info["EndpointStatus"],
-                    "Variant": production_variant.get("VariantName", "-"),
-                    "Capture": str(endpoint_info.get("DataCaptureConfig", {}).get("EnableCapture", "False")),
-                    "Samp(%)": str(endpoint_info.get("DataCaptureConfig", {}).get("CurrentSamplingPercentage", "-")),
-                }
-                data_summary.append(summary)
+        endpoint_names = [ep["EndpointName"] for page in paginator.paginate() for ep in page["Endpoints"]]
+
+        # Describe the endpoints, then pull their Workbench metadata (tags) and configurations concurrently
+        endpoint_infos = self._parallel_map(lambda n: self.sm_client.describe_endpoint(EndpointName=n), endpoint_names)
+        all_tags = self._parallel_map(lambda info: self.get_aws_tags(info["EndpointArn"]), endpoint_infos)
+        endpoint_configs = self._parallel_map(
+            lambda info: self.sm_client.describe_endpoint_config(EndpointConfigName=info["EndpointConfigName"]),
+            endpoint_infos,
+        )
+
+        for endpoint_name, endpoint_info, workbench_meta, endpoint_config in zip(
+            endpoint_names, endpoint_infos, all_tags, endpoint_configs
+        ):
+            health_tags = workbench_meta.get("workbench_health_tags", "")
+            production_variant = endpoint_config["ProductionVariants"][0]
+
+            # Determine instance type or serverless configuration
+            instance_type = production_variant.get("InstanceType")
+            if instance_type is None:
+                # If no instance type, it's a serverless configuration
+                mem_size = production_variant["ServerlessConfig"]["MemorySizeInMB"]
+                concurrency = production_variant["ServerlessConfig"]["MaxConcurrency"]
+                instance_type = f"Serverless ({mem_size//1024}GB/{concurrency})"
+
+            # Compile endpoint summary
+            summary["Name"].append(endpoint_name)
+            summary["Health"].append(health_tags)
+            summary["Instance"].append(instance_type)
+            summary["Created"].append(endpoint_info.get("CreationTime"))
+            summary["Tags"].append(workbench_meta.get("workbench_tags", "-"))
+            summary["Input"].append(workbench_meta.get("workbench_input", "-"))
+            summary["Status"].append(endpoint_info["EndpointStatus"])
+            summary["Variant"].append(production_variant.get("VariantName", "-"))
+            capture_config = endpoint_info.get("DataCaptureConfig", _EMPTY)
+            summary["Capture"].append(str(capture_config.get("EnableCapture", "False")))
+            summary["Samp(%)"].append(str(capture_config.get("CurrentSamplingPercentage", "-")))
 
         # Return the summary as a DataFrame
-        return pd.DataFrame(data_summary).convert_dtypes()
+        df = pd.DataFrame(summary, columns=_ENDPOINT_COLS)
+        df["Created"] = datetime_strings(df["Created"])
+        return df.convert_dtypes()
 
     def pipelines(self) -> pd.DataFrame:
         """List all the Pipelines in the S3 Bucket
@@ -319,25 +402,25 @@ class AWSMeta:
             pd.DataFrame: A dataframe of Pipelines information
         """
         # List pipelines stored in the parameter store
-        pipeline_summaries = []
+        summary = {c: [] for c in _PIPELINE_COLS}
+        now = datetime.now(timezone.utc)
         pipeline_list = self.param_store.list(self.pipeline_prefix)
-        for pipeline_name in pipeline_list:
-            pipeline_info = self.param_store.get(pipeline_name)
+        for pipeline_name, pipeline_info in self.param_store.get_many(pipeline_list).items():
 
             # Compile pipeline summary
-            summary = {
-                "Name": pipeline_name.replace(self.pipeline_prefix + "/", ""),
-                "Health": "",
-                "Num Stages": len(pipeline_info),
-                "Tags": pipeline_info.get("tags", "-"),
-                "Modified": datetime_string(datetime.now(timezone.utc)),
-                "Last Run": datetime_string(datetime.now(timezone.utc)),
-                "Status": "Success",  # pipeline_info.get("Status", "-"),
-            }
-            pipeline_summaries.append(summary)
+            summary["Name"].append(pipeline_name.replace(self.pipeline_prefix + "/", ""))
+            summary["Health"].append("")
+            summary["Num Stages"].append(len(pipeline_info))
+            summary["Tags"].append(pipeline_info.get("tags", "-"))
+            summary["Modified"].append(now)
+            summary["Last Run"].append(now)
+            summary["Status"].append("Success")  # pipeline_info.get("Status", "-")
 
         # Return the summary as a DataFrame
-        return pd.DataFrame(pipeline_summaries).convert_dtypes()
+        df = pd.DataFrame(summary, columns=_PIPELINE_COLS)
+        df["Modified"] = datetime_strings(df["Modified"])
+        df["Last Run"] = datetime_strings(df["Last Run"])
+        return df.convert_dtypes()
 
     @not_found_returns_none
     def glue_job(self, job_name: str) -> Union[dict, None]:
@@ -349,8 +432,7 @@ class AWSMeta:
         Returns:
             dict: A detailed description of the Glue job (None if not found).
         """
-        glue_client = self.boto3_session.client("glue")
-        job_details = glue_client.get_job(JobName=job_name)["Job"]
+        job_details = self.glue_client.get_job(JobName=job_name)["Job"]
         return {
             "Job Name": job_details["Name"],
             "Worker Type": job_details.get("WorkerType", "-"),
@@ -373,8 +455,7 @@ class AWSMeta:
             dict: A detailed description of the data source (None if not found).
         """
         # Retrieve table metadata from the Glue catalog
-        glue_client = self.boto3_session.client("glue")
-        table_details = glue_client.get_table(DatabaseName=database, Name=table_name)["Table"]
+        table_details = self.glue_client.get_table(DatabaseName=database, Name=table_name)["Table"]
         return table_details
 
     @not_found_returns_none
@@ -488,36 +569,28 @@ class AWSMeta:
     def s3_to_console_url(s3_path: str) -> str:
         """Convert an S3 path to a clickable AWS Console URL."""
         bucket, key = s3_path.replace("s3://", "").split("/", 1)
-        return f"https://s3.console.aws.amazon.com/s3/object/{bucket}?prefix={key}"
+        return _S3_CONSOLE_URL % (bucket, key)
 
     def glue_job_console_url(self, job_name: str) -> str:
         """Convert a Glue job name and region into a clickable AWS Console URL."""
-        region = self.account_clamp.region
-        return f"https://{region}.console.aws.amazon.com/gluestudio/home?region={region}#/editor/job/{job_name}/runs"
+        return _GLUE_JOB_CONSOLE_URL % {"region": self.account_clamp.region, "name": job_name}
 
     def data_catalog_console_url(self, table_name: str, database: str) -> str:
         """Convert a database and table name to a clickable Athena Console URL."""
         region = self.boto3_session.region_name
-        aws = "console.aws.amazon.com"
-        return f"https://{region}.{aws}/athena/home?region={region}#query/databases/{database}/tables/{table_name}"
+        return _DATA_CATALOG_CONSOLE_URL % {"region": region, "database": database, "name": table_name}
 
     def feature_group_console_url(self, group_name: str) -> str:
         """Generate an AWS Console URL for a given Feature Group."""
-        region = self.boto3_session.region_name
-        aws = "console.aws.amazon.com"
-        return f"https://{region}.{aws}/sagemaker/home?region={region}#/feature-groups/{group_name}/details"
+        return _FEATURE_GROUP_CONSOLE_URL % {"region": self.boto3_session.region_name, "name": group_name}
 
     def model_package_group_console_url(self, group_name: str) -> str:
         """Generate an AWS Console URL for a given Model Package Group."""
-        region = self.boto3_session.region_name
-        aws = "console.aws.amazon.com"
-        return f"https://{region}.{aws}.com/sagemaker/home?region={region}#/model-registry/{group_name}/details"
+        return _MODEL_GROUP_CONSOLE_URL % {"region": self.boto3_session.region_name, "name": group_name}
 
     def endpoint_console_url(self, endpoint_name: str) -> str:
         """Generate an AWS Console URL for a given Endpoint."""
-        region = self.boto3_session.region_name
-        aws = "console.aws.amazon.com"
-        return f"https://{region}.{aws}/sagemaker/home?region={region}#/endpoints/{endpoint_name}/details"
+        return _ENDPOINT_CONSOLE_URL % {"region": self.boto3_session.region_name, "name": endpoint_name}
 
     # Helper methods to pull specific data out of the AWS Feature Group metadata
     def _athena_database_name(self, feature_group_info: dict) -> Union[str, None]:
@@ -548,6 +621,21 @@ class AWSMeta:
         """Internal: Get the S3 File Information for the given bucket"""
         return wr.s3.describe_objects(path=bucket, boto3_session=self.boto3_session)
 
+    def _parallel_map(self, func, items: list) -> list:
+        """Internal: Apply func to each item using a thread pool (for network-bound AWS calls)
+
+        Args:
+            func (Callable): The function to apply to each item
+            items (list): The items to process
+
+        Returns:
+            list: The results, in the same order as the items
+        """
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
     @aws_throttle
     def get_aws_tags(self, arn: str) -> Union[dict, None]:
         """List the tags for the given AWS ARN"""
@@ -602,24 +690,22 @@ class AWSMeta:
             table for table in all_tables if not table["Name"].startswith("_") and table["TableType"] == table_type
         ]
 
-        # Summarize the data in a DataFrame
-        data_summary = []
+        # Summarize the data in a DataFrame (column-wise)
+        summary = {c: [] for c in _CATALOG_COLS}
         for table in filtered_tables:
-            summary = {
-                "Name": table["Name"],
-                "Owner": table.get("Parameters", {}).get("workbench_owner", "-"),
-                "Database": database,
-                "Modified": datetime_string(table["UpdateTime"]),
-                "Tags": table.get("Parameters", {}).get("workbench_tags", "-"),
-                "Columns": len(table["StorageDescriptor"].get("Columns", [])),
-                "Input": str(
-                    table.get("Parameters", {}).get("workbench_input", "-"),
-                ),
-                "_aws_url": self.data_catalog_console_url(table["Name"], database),
-            }
-            data_summary.append(summary)
-
-        return pd.DataFrame(data_summary).convert_dtypes()
+            params = table.get("Parameters", _EMPTY)
+            summary["Name"].append(table["Name"])
+            summary["Owner"].append(params.get("workbench_owner", "-"))
+            summary["Database"].append(database)
+            summary["Modified"].append(table["UpdateTime"])
+            summary["Tags"].append(params.get("workbench_tags", "-"))
+            summary["Columns"].append(len(table["StorageDescriptor"].get("Columns", _EMPTY_LIST)))
+            summary["Input"].append(str(params.get("workbench_input", "-")))
+            summary["_aws_url"].append(self.data_catalog_console_url(table["Name"], database))
+
+        df = pd.DataFrame(summary, columns=_CATALOG_COLS)
+        df["Modified"] = datetime_strings(df["Modified"])
+        return df.convert_dtypes()
 
     def _aws_pipelines(self) -> pd.DataFrame:
         """Internal: Get a summary of the Cloud internal Pipelines (not Workbench Pipelines).
@@ -629,25 +715,24 @@ class AWSMeta:
         """
         import pandas as pd
 
-        # Initialize the SageMaker client and list all pipelines
-        sagemaker_client = self.boto3_session.client("sagemaker")
-        data_summary = []
+        # Use the SageMaker client to list all pipelines
+        summary = {c: [] for c in _AWS_PIPELINE_COLS}
 
         # List all pipelines
-        pipelines = sagemaker_client.list_pipelines()["PipelineSummaries"]
+        pipelines = self.sm_client.list_pipelines()["PipelineSummaries"]
 
         # Loop through each pipeline to get its executions
         for pipeline in pipelines:
             pipeline_name = pipeline["PipelineName"]
 
             # Use paginator to retrieve all executions for this pipeline
-            paginator = sagemaker_client.get_paginator("list_pipeline_executions")
+            paginator = self.sm_client.get_paginator("list_pipeline_executions")
             for page in paginator.paginate(PipelineName=pipeline_name):
                 for execution in page["PipelineExecutionSummaries"]:
                     pipeline_execution_arn = execution["PipelineExecutionArn"]
 
                     # Get detailed information about the pipeline execution
-                    pipeline_info = sagemaker_client.describe_pipeline_execution(
+                    pipeline_info = self.sm_client.describe_pipeline_execution(
                         PipelineExecutionArn=pipeline_execution_arn
                     )
 
@@ -656,20 +741,19 @@ class AWSMeta:
                     health_tags = workbench_meta.get("workbench_health_tags", "")
 
                     # Compile pipeline summary
-                    summary = {
-                        "Name": pipeline_name,
-                        "ExecutionName": execution["PipelineExecutionDisplayName"],
-                        "Health": health_tags,
-                        "Created": datetime_string(pipeline_info.get("CreationTime")),
-                        "Tags": workbench_meta.get("workbench_tags", "-"),
-                        "Input": workbench_meta.get("workbench_input", "-"),
-                        "Status": pipeline_info["PipelineExecutionStatus"],
-                        "PipelineArn": pipeline_execution_arn,
-                    }
-                    data_summary.append(summary)
+                    summary["Name"].append(pipeline_name)
+                    summary["ExecutionName"].append(execution["PipelineExecutionDisplayName"])
+                    summary["Health"].append(health_tags)
+                    summary["Created"].append(pipeline_info.get("CreationTime"))
+                    summary["Tags"].append(workbench_meta.get("workbench_tags", "-"))
+                    summary["Input"].append(workbench_meta.get("workbench_input", "-"))
+                    summary["Status"].append(pipeline_info["PipelineExecutionStatus"])
+                    summary["PipelineArn"].append(pipeline_execution_arn)
 
         # Return the summary as a DataFrame
-        return pd.DataFrame(data_summary).convert_dtypes()
+        df = pd.DataFrame(summary, columns=_AWS_PIPELINE_COLS)
+        df["Created"] = datetime_strings(df["Created"])
+        return df.convert_dtypes()
 
     def close(self):
         """Close the AWSMeta Class"""
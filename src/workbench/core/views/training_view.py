@@ -74,9 +74,10 @@ class TrainingView(CreateView):
             instance._default_training_view(instance.data_source, id_column)
             return View(instance.data_source, instance.view_name, auto_create_view=False)
 
-        # Format the list of holdout ids for SQL IN clause
-        if holdout_ids and all(isinstance(id, str) for id in holdout_ids):
-            formatted_holdout_ids = ", ".join(f"'{id}'" for id in holdout_ids)
+        # Format the (deduplicated) list of holdout ids for a single SQL IN clause
+        holdout_ids = list(dict.fromkeys(holdout_ids))
+        if all(isinstance(id, str) for id in holdout_ids):
+            formatted_holdout_ids = ", ".join("'{}'".format(id.replace("'", "''")) for id in holdout_ids)
         else:
             formatted_holdout_ids = ", ".join(map(str, holdout_ids))
 
@@ -42,6 +42,10 @@ class View:
     log = logging.getLogger("workbench")
     meta = Meta()
 
+    # View details (columns, types, source table) are memoized by (database, table) for a short time
+    _details_cache = {}
+    _details_ttl = 60
+
     def __init__(self, artifact: Union[DataSource, FeatureSet], view_name: str, **kwargs):
         """View Constructor: Retrieve a View for the given artifact
 
@@ -69,8 +73,8 @@ class View:
         self.auto_created = False
         if kwargs.get("auto_create_view", True) and not self.exists():
 
-            # A direct double check before we auto-create
-            if not self.exists(skip_cache=True):
+            # A direct double check before we auto-create (skip the Athena query if the data source is missing)
+            if not self.data_source.exists() or not self.exists(skip_cache=True):
                 self.log.important(
                     f"View {self.view_name} for {self.artifact_name} doesn't exist, attempting to auto-create..."
                 )
@@ -84,27 +88,31 @@ class View:
                     self.view_name = self.columns = self.column_types = self.source_table = self.base_table_name = None
                     return
 
-        # Now fill some details about the view
-        self.columns, self.column_types, self.source_table, self.join_view = view_details(
-            self.table, self.data_source.database, self.data_source.boto3_session
-        )
+        # Now fill some details about the view (a view that was just created always gets fresh details)
+        refresh = self.auto_created or not kwargs.get("auto_create_view", True)
+        self.columns, self.column_types, self.source_table, self.join_view = self._view_details(refresh)
 
-    def pull_dataframe(self, limit: int = 50000, head: bool = False) -> Union[pd.DataFrame, None]:
+    def pull_dataframe(
+        self, limit: int = 50000, head: Union[bool, int] = False, unload: bool = False
+    ) -> Union[pd.DataFrame, None]:
         """Pull a DataFrame based on the view type
 
         Args:
             limit (int): The maximum number of rows to pull (default: 50000)
-            head (bool): Return just the head of the DataFrame (default: False)
+            head (Union[bool, int]): Return just the head of the DataFrame, True for 5 rows or
+                                     an int for that many rows (default: False)
+            unload (bool): Read the results through an Athena UNLOAD (Parquet), faster for large pulls
+                           but the column dtypes come from Parquet instead of CSV inference (default: False)
 
         Returns:
             Union[pd.DataFrame, None]: The DataFrame for the view or None if it doesn't exist
         """
 
-        # Pull the DataFrame
+        # The head is pushed down into the query (LIMIT) so Athena only returns the rows we need
         if head:
-            limit = 5
+            limit = 5 if head is True else min(int(head), limit)
         pull_query = f'SELECT * FROM "{self.table}" LIMIT {limit}'
-        df = self.data_source.query(pull_query)
+        df = self.data_source.database_query(self.database, pull_query, unload=unload)
         return df
 
     def query(self, query: str) -> Union[pd.DataFrame, None]:
@@ -162,6 +170,9 @@ class View:
             else:
                 raise
 
+        # Drop any memoized details for this view
+        self._details_cache.pop((self.database, self.table), None)
+
         # We want to do a small sleep so that AWS has time to catch up
         self.log.info("Sleeping for 3 seconds after dropping view to allow AWS to catch up...")
         time.sleep(3)
@@ -218,6 +229,41 @@ class View:
         _df = self.data_source.query(check_table_query)
         return not _df.empty
 
+    def _view_details(self, refresh: bool = False) -> tuple:
+        """Internal: Get the details for this view (memoized by database/table)
+
+        Args:
+            refresh (bool): Skip the memoized details and pull them from Glue (default: False)
+
+        Returns:
+            tuple: The column names, column types, source table, and join view flag
+        """
+        key = (self.database, self.table)
+        now = time.time()
+        cached = self._details_cache.get(key)
+        if refresh or not cached or now - cached[0] >= self._details_ttl:
+            # Pull the details and memoize them (only if the view was found)
+            details = view_details(self.table, self.database, self.data_source.boto3_session)
+            if details[0] is None:
+                return details
+            cached = self._details_cache[key] = (now, details)
+
+        # Each View gets its own copies of the (mutable) column lists
+        columns, column_types, *rest = cached[1]
+        return (list(columns), list(column_types), *rest)
+
+    @classmethod
+    def clear_details_cache(cls, database: str, base_table_name: str):
+        """Drop the memoized details for a base table and all of its views
+
+        Args:
+            database (str): The database name
+            base_table_name (str): The base table name (views are named {base_table_name}_{view_name})
+        """
+        for db, table in list(cls._details_cache):
+            if db == database and (table == base_table_name or table.startswith(f"{base_table_name}_")):
+                cls._details_cache.pop((db, table), None)
+
     def _auto_create_view(self) -> bool:
         """Internal: Automatically create a view training, display, and computation views
 
@@ -144,6 +144,8 @@ def delete_views_and_supplemental_data(base_table_name: str, database: str, boto
         database (str): The database name
         boto3_session: The boto3 session
     """
+    from workbench.core.views.view import View
+
     log.info(f"Deleting views and supplemental data for {base_table_name}:{database}.")
     for view_table in list_view_tables(base_table_name, database):
         log.info(f"Deleting view {view_table}:{database}...")
@@ -152,6 +154,9 @@ def delete_views_and_supplemental_data(base_table_name: str, database: str, boto
         log.info(f"Deleting supplemental {supplemental_data_table}:{database}...")
         delete_table(supplemental_data_table, database, boto3_session)
 
+    # Drop any memoized View details for these tables
+    View.clear_details_cache(database, base_table_name)
+
 
 def delete_table(table_name: str, database: str, boto3_session):
     """Delete a table from the Glue Catalog
@@ -327,8 +327,8 @@ class WorkbenchShell:
         # Print out the AWS Artifacts Summary
         cprint("yellow", "\nAWS Artifacts Summary:")
         for name, df in summary_data.items():
-            # Pad the name to 15 characters
-            name = (name + " " * 15)[:15]
+            # Pad/truncate the name to 15 characters
+            name = f"{name:<15.15}"
 
             # Sanity check the dataframe
             if df.empty:
@@ -341,7 +341,7 @@ class WorkbenchShell:
                     examples = examples[:70] + "..."
 
             # Print the summary
-            cprint(["lightpurple", "\t" + name, "lightgreen", str(df.shape[0]) + "  ", "purple_blue", examples])
+            cprint(["lightpurple", f"\t{name}", "lightgreen", f"{df.shape[0]}  ", "purple_blue", examples])
 
     def incoming_data(self):
         return self.meta.incoming_data()
@@ -18,6 +18,14 @@ from sagemaker.session import Session as SageSession
 from sagemaker import image_uris
 from collections.abc import Mapping, Iterable
 
+# Optional: orjson for faster JSON decoding of metadata/tags
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
 
 # Workbench Imports
 from workbench.utils.deprecated_utils import deprecated
@@ -257,6 +265,16 @@ def workbench_meta_from_catalog_table_meta(table_meta: dict) -> dict:
     return {key: decode_value(value) for key, value in params.items() if "workbench" in key}
 
 
+def _json_loads(value):
+    """Internal: JSON decode using orjson when available (falls back to json for NaN/Infinity/big ints)"""
+    if HAVE_ORJSON:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
 def decode_value(value):
     # Try to base64 decode the value
     try:
@@ -265,7 +283,7 @@ def decode_value(value):
         pass
     # Try to JSON decode the value
     try:
-        value = json.loads(value)
+        value = _json_loads(value)
     except Exception:
         pass
 
@@ -367,7 +385,7 @@ def aws_tags_to_dict(aws_tags) -> dict:
         except UnicodeDecodeError:
             stitched_json_str = stitched_base64_str
         try:
-            stitched_dict = json.loads(stitched_json_str)
+            stitched_dict = _json_loads(stitched_json_str)
         except json.decoder.JSONDecodeError:
             stitched_dict = stitched_json_str
 
@@ -547,7 +565,7 @@ def aws_url(artifact_info, artifact_type, aws_account_clamp):
         return f"{base_url}?region={region}#/editor/job/{job_name}/details"
     elif artifact_type == "DataSource":
         details = artifact_info.get("Parameters", {}).get("workbench_details", "{}")
-        return json.loads(details).get("aws_url", "unknown")
+        return _json_loads(details).get("aws_url", "unknown")
     elif artifact_type == "FeatureSet":
         aws_url = artifact_info.get("workbench_meta", {}).get("aws_url", "unknown")
         # Hack for constraints on the SageMaker Feature Group Tags
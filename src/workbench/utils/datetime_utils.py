@@ -1,12 +1,17 @@
 """Helper functions for working with ISO-8601 formatted dates and times"""
 
 from datetime import datetime, date, timezone
+from dateutil.tz import tzlocal
 import numpy as np
+import pandas as pd
 import logging
 import time
 
 log = logging.getLogger("workbench")
 
+# Display format used by datetime_string() and datetime_strings()
+_DISPLAY_FORMAT = "%Y-%m-%d %H:%M"
+
 # A simple log throttle for specific log messages
 last_log = 0
 log_interval = 5  # seconds
@@ -99,6 +104,10 @@ def datetime_string(datetime_obj: datetime) -> str:
     if datetime_obj is None or datetime_obj == placeholder:
         return placeholder
 
+    # Fast path for the common case (exact datetime type, strftime with the fixed format can't fail)
+    if type(datetime_obj) is datetime:
+        return datetime_obj.strftime(_DISPLAY_FORMAT)
+
     if not isinstance(datetime_obj, datetime):
         log.debug("Expected datetime object.. trying to convert...")
         try:
@@ -108,12 +117,28 @@ def datetime_string(datetime_obj: datetime) -> str:
             return str(datetime_obj)
 
     try:
-        return datetime_obj.strftime("%Y-%m-%d %H:%M")
+        return datetime_obj.strftime(_DISPLAY_FORMAT)
     except Exception as e:
         log.error(f"Failed to convert datetime to string: {e}")
         return str(datetime_obj)
 
 
+def datetime_strings(values: pd.Series) -> pd.Series:
+    """Helper: Vectorized version of datetime_string() for a whole Series/column.
+
+    Args:
+        values (pd.Series): A Series of datetime objects and/or ISO-8601 strings.
+
+    Returns:
+        pd.Series: The datetimes as "YYYY-MM-DD HH:MM" strings (local time), "-" for missing/invalid values.
+
+    Note:
+        The values are shown in the local timezone, matching datetime_string() for the (tzlocal) AWS timestamps
+    """
+    datetimes = pd.to_datetime(values, errors="coerce", utc=True).dt.tz_convert(tzlocal())
+    return datetimes.dt.strftime(_DISPLAY_FORMAT).fillna("-")
+
+
 if __name__ == "__main__":
     """Exercise the helper functions"""
 
@@ -135,3 +160,6 @@ if __name__ == "__main__":
 
     # Test the datetime string conversion
     print(datetime_string(now))
+
+    # Test the vectorized datetime string conversion
+    print(datetime_strings(pd.Series([now, now_str, None, "-"])))
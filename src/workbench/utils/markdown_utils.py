@@ -1,5 +1,8 @@
 """Markdown Utility/helper methods"""
 
+from functools import lru_cache
+import pandas as pd
+
 from workbench.utils.symbols import health_icons
 
 
@@ -10,6 +13,13 @@ def health_tag_markdown(health_tags: list[str]) -> str:
     Returns:
         str: A markdown string
     """
+    # Most artifacts share a handful of tag combinations, so the markdown is cached by tags
+    return _health_tag_markdown(tuple(health_tags or ()))
+
+
+@lru_cache(maxsize=64)
+def _health_tag_markdown(health_tags: tuple[str, ...]) -> str:
+    """Internal: Generate the health tag markdown for a tuple of health tags"""
     # If we have no health tags, then add a bullet for healthy
     markdown = "**Health Checks**\n"  # Header for Health Checks
 
@@ -30,6 +40,20 @@ def health_tag_markdown(health_tags: list[str]) -> str:
     return markdown
 
 
+def df_to_markdown(df: pd.DataFrame) -> str:
+    """Render a (small) DataFrame as a markdown table (without the index)
+
+    Args:
+        df (pd.DataFrame): The DataFrame to render
+
+    Returns:
+        str: A markdown table string
+    """
+    lines = ["| " + " | ".join(map(str, df.columns)) + " |", "|" + "|".join(["---"] * len(df.columns)) + "|"]
+    lines.extend("| " + " | ".join(map(str, row)) + " |" for row in df.itertuples(index=False, name=None))
+    return "\n".join(lines)
+
+
 if __name__ == "__main__":
     """Exercise the Markdown Utilities"""
     from workbench.api.model import Model
@@ -40,3 +64,6 @@ if __name__ == "__main__":
 
     # Print the health tag markdown
     print(health_tag_markdown(health_tags))
+
+    # Print a DataFrame as a markdown table
+    print(df_to_markdown(pd.DataFrame({"metric": ["rmse", "r2"], "value": [0.123, 0.876]})))
@@ -18,6 +18,9 @@ from workbench.web_interface.page_views.page_view import PageView
 from workbench.web_interface.components.plugin_interface import PluginInterface
 from workbench.web_interface.components.plugin_interface import PluginPage
 
+# Loaded plugin modules, keyed by file path: {file_path: (modified_time, module)}
+_MODULE_CACHE: Dict[str, tuple] = {}
+
 
 class PluginManager:
     """A Singleton Plugin Manager Class: Manages the loading and retrieval of Workbench plugins"""
@@ -91,11 +94,14 @@ class PluginManager:
         if not os.path.isdir(plugin_dir):
             return
 
-        # For every file in the plugin directory
-        for filename in os.listdir(plugin_dir):
+        # For every python file in the plugin directory (DirEntry objects carry the path and file type)
+        with os.scandir(plugin_dir) as entries:
+            plugin_files = [e for e in entries if e.is_file() and e.name.endswith(".py") and not e.name.startswith("_")]
+        for entry in plugin_files:
+            filename = entry.name
 
             # Normal plugin loading
-            module = self._load_module(plugin_dir, filename)
+            module = self._load_module(entry)
             if module is None:
                 self.log.warning(f"Failed to load plugin: '{filename}' skipping...")
                 continue
@@ -116,7 +122,7 @@ class PluginManager:
                             # PluginInterface has additional information for failed validation
                             valid, validation_error = PluginInterface.validate_subclass(attr)
                             self.log.error(f"Plugin '{attr_name}' failed validation:")
-                            self.log.error(f"\tFile: {os.path.join(plugin_dir, filename)}")
+                            self.log.error(f"\tFile: {entry.path}")
                             self.log.error(f"\tClass: {attr_name}")
                             self.log.error(f"\tDetails: {filename} {validation_error}")
 
@@ -135,20 +141,24 @@ class PluginManager:
                     else:
                         self.log.error(f"Unexpected plugin type '{plugin_type}' for plugin '{attr_name}'")
 
-    def _load_module(self, dir_path: str, filename: str) -> Optional[ModuleType]:
-        """Internal: Load a module from a file"""
+    def _load_module(self, entry: os.DirEntry) -> Optional[ModuleType]:
+        """Internal: Load a module from a file (reusing the cached module if the file hasn't changed)"""
         try:
-            if filename.endswith(".py") and not filename.startswith("_"):
-                file_path = os.path.join(dir_path, filename)
-                module_name = filename[:-3]
-                spec = importlib.util.spec_from_file_location(module_name, file_path)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    return module
+            file_path = entry.path
+            modified_time = entry.stat().st_mtime
+            cached = _MODULE_CACHE.get(file_path)
+            if cached and cached[0] == modified_time:
+                return cached[1]
+            module_name = entry.name[:-3]
+            spec = importlib.util.spec_from_file_location(module_name, file_path)
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                _MODULE_CACHE[file_path] = (modified_time, module)
+                return module
         except Exception as e:
             # Log or handle the exception as needed
-            self.log.critical(f"Failed to load plugin: '{filename}': {e}")
+            self.log.critical(f"Failed to load plugin: '{entry.name}': {e}")
         return None
 
     def get_all_plugins(self) -> Dict[str, dict[Any]]:
@@ -172,12 +182,7 @@ class PluginManager:
         Returns:
             List[Any]: A list of INSTANTIATED plugin classes for the requested page.
         """
-        plugin_classes = [
-            self.plugins["components"][x]
-            for x in self.plugins["components"]
-            if self.plugins["components"][x].auto_load_page == plugin_page
-        ]
-        return [x() for x in plugin_classes]
+        return [x() for x in self.plugins["components"].values() if x.auto_load_page == plugin_page]
 
     def get_web_plugin(self, plugin_name: str) -> PluginInterface:
         """
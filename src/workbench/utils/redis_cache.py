@@ -1,4 +1,5 @@
 import json
+import threading
 import numpy as np
 import pandas as pd
 import redis
@@ -25,6 +26,9 @@ class RedisCache:
         redis_cache.clear()
     """
 
+    # Max number of decoded DataFrames to keep (per RedisCache instance)
+    decoded_cache_size = 32
+
     def __init__(self, expire=None, prefix="", postfix=""):
         """RedisCache Initialization
         Args:
@@ -39,6 +43,10 @@ class RedisCache:
         self.prefix = self.base_prefix + self.prefix
         self.postfix = postfix if not postfix or postfix.startswith(":") else ":" + postfix
 
+        # Decoded DataFrames, reused while their raw (JSON) value in Redis hasn't changed
+        self._decoded = {}  # {key: (raw_value, DataFrame)}
+        self._decoded_lock = threading.Lock()
+
         # Load Redis configuration from the Workbench ConfigManager
         cm = ConfigManager()
         self.host = cm.get_config("REDIS_HOST", "localhost")
@@ -88,7 +96,22 @@ class RedisCache:
             the value of the item or None if the item isn't in the redis_cache
         """
         raw_value = self._get(key)
-        return json.loads(raw_value, object_hook=custom_decoder) if raw_value else None
+        if not raw_value:
+            return None
+
+        # Decoding a DataFrame is expensive, so reuse the last decode if the raw value hasn't changed
+        #   Note: DataFrames are returned as copies so callers can't modify the decoded DataFrame
+        decoded = self._decoded.get(key)
+        if decoded is not None and decoded[0] == raw_value:
+            return decoded[1].copy()
+        value = json.loads(raw_value, object_hook=custom_decoder)
+        if not isinstance(value, pd.DataFrame):
+            return value
+        with self._decoded_lock:
+            if key not in self._decoded and len(self._decoded) >= self.decoded_cache_size:
+                self._decoded.pop(next(iter(self._decoded)))
+            self._decoded[key] = (raw_value, value)
+        return value.copy()
 
     def _set(self, key, value):
         """Internal Method: Add an item to the redis_cache"""
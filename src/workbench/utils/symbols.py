@@ -1,5 +1,9 @@
 """Unicode Symbols for Workbench"""
 
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
 # A Dictionary/Map of Health Tags to Symbols
 health_icons = {
     "failed": "🔴",
@@ -17,6 +21,7 @@ health_icons = {
 }
 
 
+@lru_cache(maxsize=1024)
 def tag_symbols(tag_list: str) -> str:
     """Return the symbols for the given list of tags"
     Args:
@@ -41,3 +46,30 @@ def tag_symbols(tag_list: str) -> str:
     for tag in tag_list:
         symbol_list.append(health_icons.get(tag, tag))
     return "".join(symbol_list)
+
+
+def _is_symbol(value) -> bool:
+    """Internal: Check if a Health value is already a symbol string (health tags are plain ASCII)"""
+    return isinstance(value, str) and value != "" and ord(value[0]) > 0x2000
+
+
+def health_symbols(health: pd.Series) -> pd.Series:
+    """Convert a Series of health tag strings into their symbols
+
+    Args:
+        health (pd.Series): A Series of health tag strings (tags separated by :)
+
+    Returns:
+        pd.Series: A Series of symbol strings (missing values become "")
+
+    Note:
+        There are only a handful of distinct health strings, so the Series is converted to a categorical,
+        tag_symbols() is called once per category, and the symbols are gathered with the category codes.
+    """
+    # Already converted to symbols? (e.g. a page view converted them before the table did)
+    if len(health) and _is_symbol(health.iat[0]):
+        return health
+
+    health = health.astype("category")
+    symbols = np.append(health.cat.categories.map(tag_symbols).to_numpy(dtype=object), "")  # code -1 (NaN) -> ""
+    return pd.Series(symbols[health.cat.codes.to_numpy()], index=health.index, name=health.name)
@@ -179,7 +179,7 @@ class TestDataGenerator:
         """
         df = pd.DataFrame()
         df["Id"] = range(1, rows + 1)
-        df["Name"] = ["Person " + str(i) for i in range(1, rows + 1)]
+        df["Name"] = "Person " + df["Id"].astype(str)
 
         # Height will be normally distributed with mean 68 and std 4
         df["Height"] = np.random.normal(68, 4, rows)
@@ -205,19 +205,16 @@ class TestDataGenerator:
         food_list = "pizza, tacos, steak, sushi".split(", ")
         df["Food"] = self.generate_correlated_series(df["Salary"], 0.8, -1.5, 4.4)
 
-        # Round to nearest integer
-        df["Food"] = df["Food"].round().astype(int).clip(0, len(food_list) - 1)
-
-        # Convert integers to food strings
-        df["Food"] = df["Food"].apply(lambda x: food_list[x])
+        # Round to nearest integer and convert the integers to food strings
+        food_codes = df["Food"].round().astype(int).clip(0, len(food_list) - 1).to_numpy()
+        df["Food"] = np.array(food_list, dtype=object)[food_codes]
 
         # Randomly apply some NaNs to the Food column
-        df["Food"] = df["Food"].apply(lambda x: np.nan if np.random.random() < 0.1 else x)
+        df.loc[np.random.random(rows) < 0.1, "Food"] = np.nan
 
         # Boolean column for liking dogs (correlated to IQ)
         df["Likes_Dogs"] = self.generate_correlated_series(df["IQ_Score"], 0.75, -0.5, 1.5)
-        df["Likes_Dogs"] = df["Likes_Dogs"].round().astype(int).clip(0, 1)
-        df["Likes_Dogs"] = df["Likes_Dogs"].apply(lambda x: True if x == 1 else False)
+        df["Likes_Dogs"] = df["Likes_Dogs"].round().astype(int).clip(0, 1) == 1
 
         # Date is a random date between 1/1/2022 and 12/31/2022
         df["Date"] = pd.date_range(start="1/1/2022", end="12/31/2022", periods=rows, tz="US/Mountain")
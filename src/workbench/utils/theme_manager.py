@@ -12,6 +12,12 @@ from workbench.api import ParameterStore
 
 
 class ThemeManager:
+    """Manages the Dashboard themes (CSS, Plotly templates, and colorscales)
+
+    Note: ThemeManager is a process-wide singleton, the themes are only loaded by the first
+          ThemeManager() call, so components can just call ThemeManager() in their constructors.
+    """
+
     _instance = None  # Singleton instance
 
     # Class-level state
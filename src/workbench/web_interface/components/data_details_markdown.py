@@ -1,10 +1,72 @@
 """A Markdown Component for details/information about DataSources (and FeatureSets)"""
 
+import re
+from functools import lru_cache
+from string import Template
 from dash import dcc
 
 # Workbench Imports
 from workbench.web_interface.components.component_interface import ComponentInterface
 
+# Column types that get numeric (min/max/zeros) details
+_NUMERIC_TYPES = frozenset({"tinyint", "smallint", "int", "bigint", "float", "double", "decimal"})
+_FLOAT_TYPES = frozenset({"float", "double", "decimal"})
+
+# Short display names for the FeatureSet types
+_SHORTEN_MAP = {
+    "Integral": "I",
+    "Fractional": "F",
+    "String": "S",
+    "Timestamp": "TS",
+    "Boolean": "B",
+}
+
+# Templates are compiled once at import time
+_MARKDOWN_TEMPLATE = Template("""
+        **Rows:** ${num_rows}
+        <br>**Columns:** ${num_columns}
+        <br>**Created/Mod:** ${created} / ${modified}
+        <br>**Tags:** ${workbench_tags}
+        <br>**Input:** ${input}
+
+        #### Numeric Columns
+        ${numeric_column_details}
+
+        #### Non-Numeric Columns
+        ${string_column_details}
+        """)
+_MARKDOWN_KEYS = frozenset(re.findall(r"\$\{(\w+)\}", _MARKDOWN_TEMPLATE.template))
+
+# ISO dates (2024-01-02T03:04:05.000Z) get displayed as 2024-01-02 03:04:05
+_ISO_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}:\d{2})\.000Z")
+
+_EXPANDING_LIST = Template("""
+        <details>
+            <summary>${column_info}</summary>
+            <ul>
+            ${bullet_list}
+            </ul>
+        </details>
+        """)
+
+_COLUMN_HEADER = """<b>${name}</b> <span class="blue-text">(${full_type})</span>:"""
+
+# Min/Max range formatters (floats get 2 decimal places, integers get none)
+_FLOAT_RANGE = " {:.2f} → {:.2f}&nbsp;&nbsp;&nbsp;&nbsp;".format
+_INT_RANGE = " {:d} → {:d}&nbsp;&nbsp;&nbsp;&nbsp;".format
+
+# Memo of rendered column HTML (column stats rarely change between page renders)
+_COLUMN_HTML_CACHE = {}
+_COLUMN_HTML_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def _full_type(fs_dtype: str, dtype: str) -> str:
+    """Internal: Display type for a column (FeatureSet type prefix when we have one)"""
+    if fs_dtype is None:
+        return dtype
+    return f"{_SHORTEN_MAP.get(fs_dtype, 'V')}: {dtype}"
+
 
 class DataDetailsMarkdown(ComponentInterface):
     """Data Details Markdown Component"""
@@ -27,135 +89,81 @@ class DataDetailsMarkdown(ComponentInterface):
             str: A Markdown string
         """
 
-        markdown_template = """
-        **Rows:** <<num_rows>>
-        <br>**Columns:** <<num_columns>>
-        <br>**Created/Mod:** <<created>> / <<modified>>
-        <br>**Tags:** <<workbench_tags>>
-        <br>**Input:** <<input>>
-
-        #### Numeric Columns
-        <<numeric_column_details>>
-
-        #### Non-Numeric Columns
-        <<string_column_details>>
-        """
-
-        expanding_list = """
-        <details>
-            <summary><<column_info>></summary>
-            <ul>
-            <<bullet_list>>
-            </ul>
-        </details>
-        """
-
         # Sanity Check for empty data
         if not data_details:
             return "No data source details found"
 
-        # Loop through all the details and replace in the template
-        for key, value in data_details.items():
+        # Stringify only the details that the template actually references
+        details = {}
+        for key in _MARKDOWN_KEYS.intersection(data_details):
+            value = data_details[key]
             # Hack for dates
-            if ".000Z" in str(value):
-                try:
-                    value = value.replace(".000Z", "").replace("T", " ")
-                except AttributeError:
-                    pass
-            markdown_template = markdown_template.replace(f"<<{key}>>", str(value))
+            if isinstance(value, str) and value.endswith(".000Z"):
+                value = _ISO_DATE_RE.sub(r"\1 \2", value)
+            details[key] = str(value)
 
-        # Fill in numeric column details
+        # Partition the columns once: numeric and non-numeric (dates/timestamps are skipped)
         column_stats = data_details.get("column_stats", {})
-        numeric_column_details = ""
-        numeric_types = [
-            "tinyint",
-            "smallint",
-            "int",
-            "bigint",
-            "float",
-            "double",
-            "decimal",
-        ]
+        numeric_columns, string_columns = [], []
         for column_name, column_info in column_stats.items():
-            if column_info["dtype"] in numeric_types:
-                column_html = self._column_info_html(column_name, column_info)
-                column_details = expanding_list.replace("<<column_info>>", column_html)
-
-                # Populate the bullet list (descriptive_stats and unique)
-                bullet_list = ""
-                for q, value in column_info["descriptive_stats"].items():
-                    if value is not None:
-                        bullet_list += f"<li>{q}: {value:.3f}</li>"
-                bullet_list += f"<li>Unique: {column_info['unique']}</li>"
-
-                # Add correlations if they exist
-                if column_info.get("correlations"):
-                    corr_title = """<span class="green-text"><b>Correlated Columns</b></span>"""
-                    corr_details = expanding_list.replace("<<column_info>>", corr_title)
-                    corr_details = f"""<li class="no-bullet">{corr_details}</li>"""
-                    corr_list = ""
-                    for col, corr in column_info["correlations"].items():
-                        corr_list += f"<li>{col}: {corr:.3f}</li>"
-                    corr_details = corr_details.replace("<<bullet_list>>", corr_list)
-                    bullet_list += corr_details
-
-                # Add the bullet list to the column details
-                column_details = column_details.replace("<<bullet_list>>", bullet_list)
-
-                # Add the column details to the markdown
-                numeric_column_details += column_details
-
-        # Now actually replace the column details in the markdown
-        markdown_template = markdown_template.replace("<<numeric_column_details>>", numeric_column_details)
+            dtype = column_info["dtype"]
+            if dtype in _NUMERIC_TYPES:
+                numeric_columns.append((column_name, column_info))
+            elif dtype != "timestamp":
+                string_columns.append((column_name, column_info))
 
-        # For string columns create collapsible sections that show value counts
-        string_column_details = ""
-        for column_name, column_info in column_stats.items():
-            # Skipping any columns that are numeric
-            if column_info["dtype"] in numeric_types:
-                continue
+        # Fill in numeric column details
+        numeric_parts = []
+        for column_name, column_info in numeric_columns:
+            column_html = self._column_info_html(column_name, column_info)
 
-            # Skipping any columns that are dates/timestamps
-            if column_info["dtype"] == "timestamp":
-                continue
+            # Populate the bullet list (descriptive_stats and unique)
+            stats = column_info["descriptive_stats"].items()
+            bullet_list = "".join(f"<li>{q}: {value:.3f}</li>" for q, value in stats if value is not None)
+            bullet_list += f"<li>Unique: {column_info['unique']}</li>"
 
+            # Add correlations if they exist
+            correlations = column_info.get("correlations")
+            if correlations:
+                corr_title = """<span class="green-text"><b>Correlated Columns</b></span>"""
+                corr_list = "".join(f"<li>{col}: {corr:.3f}</li>" for col, corr in correlations.items())
+                corr_details = _EXPANDING_LIST.substitute(column_info=corr_title, bullet_list=corr_list)
+                bullet_list += f"""<li class="no-bullet">{corr_details}</li>"""
+
+            # Fill in the column info and the bullet list in one pass
+            column_details = _EXPANDING_LIST.substitute(column_info=column_html, bullet_list=bullet_list)
+
+            # Add the column details to the markdown
+            numeric_parts.append(column_details)
+
+        # For string columns create collapsible sections that show value counts
+        string_parts = []
+        for column_name, column_info in string_columns:
             # Create the column info
             column_html = self._column_info_html(column_name, column_info)
-            column_details = expanding_list.replace("<<column_info>>", column_html)
 
             # Populate the bullet list (if we have value counts)
-            if "value_counts" not in column_info:
+            value_counts = column_info.get("value_counts")
+            if value_counts is None:
                 bullet_list = "<li>No Value Counts</li>"
             else:
-                bullet_list = ""
-                for value, count in column_info["value_counts"].items():
-                    bullet_list += f"<li>{value}: {count}</li>"
+                bullet_list = "".join(f"<li>{value}: {count}</li>" for value, count in value_counts.items())
 
-            # Add the bullet list to the column details
-            column_details = column_details.replace("<<bullet_list>>", bullet_list)
+            # Fill in the column info and the bullet list in one pass
+            column_details = _EXPANDING_LIST.substitute(column_info=column_html, bullet_list=bullet_list)
 
             # Add the column details to the markdown
-            string_column_details += column_details
+            string_parts.append(column_details)
 
-        # Now actually replace the column details in the markdown
-        markdown = markdown_template.replace("<<string_column_details>>", string_column_details)
-        return markdown
+        # Now fill in the whole markdown template in a single pass
+        details["numeric_column_details"] = "".join(numeric_parts)
+        details["string_column_details"] = "".join(string_parts)
+        return _MARKDOWN_TEMPLATE.safe_substitute(details)
 
     @staticmethod
     def _construct_full_type(column_info: dict) -> dict:
         """Internal: Show the FeatureSet Types if they exist"""
-        shorten_map = {
-            "Integral": "I",
-            "Fractional": "F",
-            "String": "S",
-            "Timestamp": "TS",
-            "Boolean": "B",
-        }
-        if "fs_dtype" in column_info:
-            display_fs_type = shorten_map.get(column_info["fs_dtype"], "V")
-            column_info["full_type"] = f"{display_fs_type}: {column_info['dtype']}"
-        else:
-            column_info["full_type"] = column_info["dtype"]
+        column_info["full_type"] = _full_type(column_info.get("fs_dtype"), column_info["dtype"])
         return column_info
 
     def _column_info_html(self, column_name, column_info: dict) -> str:
@@ -167,60 +175,71 @@ class DataDetailsMarkdown(ComponentInterface):
             str: An HTML string
         """
 
+        # Construct the full type
+        column_info = self._construct_full_type(column_info)
+
+        # Pull the fields we need out of the column info once
+        dtype = column_info["dtype"]
+        unique = column_info.get("unique")
+        nulls = column_info["nulls"]
+        num_zeros = column_info.get("num_zeros", 0)
+        full_type = column_info["full_type"]
+        stats = column_info.get("descriptive_stats") or {}
+
+        # Have we already rendered this exact column?
+        key = (column_name, full_type, unique, nulls, num_zeros, stats.get("min"), stats.get("max"))
+        html = _COLUMN_HTML_CACHE.get(key)
+        if html is not None:
+            return html
+
         # First part of the HTML template is the same for all columns
-        html_template = """<b><<name>></b> <span class="blue-text">(<<full_type>>)</span>:"""
+        html_template = _COLUMN_HEADER
 
         # Add min, max, and number of zeros for numeric columns
-        numeric_types = [
-            "tinyint",
-            "smallint",
-            "int",
-            "bigint",
-            "float",
-            "double",
-            "decimal",
-        ]
-        float_types = ["float", "double", "decimal"]
-        if column_info["dtype"] in numeric_types:
+        if dtype in _NUMERIC_TYPES:
             # Just hardcode the min and max for now
-            min = column_info["descriptive_stats"]["min"]
-            max = column_info["descriptive_stats"]["max"]
+            min = stats["min"]
+            max = stats["max"]
 
             # Sanity Check
             if min is None or max is None:
                 html_template += """ <span class="red-text">No Stats</span>"""
 
             # Floats get 2 decimal places
-            elif column_info["dtype"] in float_types:
-                html_template += f""" {min:.2f} → {max:.2f}&nbsp;&nbsp;&nbsp;&nbsp;"""
+            elif dtype in _FLOAT_TYPES:
+                html_template += _FLOAT_RANGE(min, max)
 
             # Integers get no decimal places
             else:
-                html_template += f""" {int(min)} → {int(max)}&nbsp;&nbsp;&nbsp;&nbsp;"""
-            if column_info["unique"] == 2 and min == 0 and max == 1:
+                html_template += _INT_RANGE(int(min), int(max))
+            if unique == 2 and min == 0 and max == 1:
                 html_template += """ <span class="green-text"> Binary</span>"""
-            elif column_info["num_zeros"] > 0:
-                html_template += """ <span class="orange-text"> Zero: <<num_zeros>></span>"""
+            elif num_zeros > 0:
+                html_template += """ <span class="orange-text"> Zero: ${num_zeros}</span>"""
 
         # Non-numeric columns get the number of unique values
         else:
-            html_template += """ Unique: <<unique>> """
+            html_template += """ Unique: ${unique} """
 
         # Do we have any nulls in this column?
-        if column_info["nulls"] > 0:
-            html_template += """ <span class="red-text">Null: <<nulls>></span>"""
-
-        # Replace the column name
-        html_template = html_template.replace("<<name>>", column_name)
-
-        # Construct the full type
-        column_info = self._construct_full_type(column_info)
-
-        # Loop through all the details and replace in the template
-        for key, value in column_info.items():
-            html_template = html_template.replace(f"<<{key}>>", str(value))
+        if nulls > 0:
+            html_template += """ <span class="red-text">Null: ${nulls}</span>"""
+
+        # Substitute just the fields the template uses (in a single pass)
+        fields = {
+            "name": column_name,
+            "full_type": full_type,
+            "num_zeros": num_zeros,
+            "unique": unique,
+            "nulls": nulls,
+        }
+        html = Template(html_template).safe_substitute(fields)
 
-        return html_template
+        # Store in the memo (evicting the oldest entry when full)
+        if len(_COLUMN_HTML_CACHE) >= _COLUMN_HTML_CACHE_SIZE:
+            _COLUMN_HTML_CACHE.pop(next(iter(_COLUMN_HTML_CACHE)))
+        _COLUMN_HTML_CACHE[key] = html
+        return html
 
 
 if __name__ == "__main__":
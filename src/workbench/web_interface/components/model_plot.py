@@ -15,6 +15,20 @@ from workbench.web_interface.components.regression_plot import RegressionPlot
 class ModelPlot(ComponentInterface):
     """Model Metrics Components"""
 
+    def __init__(self):
+        """Initialize the Model Plot Class"""
+
+        # Plot components for each model type (created once and reused for every update)
+        regression_plot = RegressionPlot()
+        self.model_plots = {
+            "classifier": ConfusionMatrix(),
+            "regressor": regression_plot,
+            "quantile_regressor": regression_plot,
+        }
+
+        # Call the parent class constructor
+        super().__init__()
+
     def create_component(self, component_id: str) -> dcc.Graph:
         # Initialize an empty plot figure
         return dcc.Graph(id=component_id, figure=self.display_text("Waiting for Data..."))
@@ -37,13 +51,14 @@ class ModelPlot(ComponentInterface):
 
         # Based on the model type, we'll generate a different plot
         model_type = model_details.get("model_type")
-        if model_type == "classifier":
-            return ConfusionMatrix().update_properties(model, inference_run=inference_run)[0]
-        elif model_type in ["regressor", "quantile_regressor"]:
-            return RegressionPlot().update_properties(model, inference_run)
-        else:
+        model_plot = self.model_plots.get(model_type)
+        if model_plot is None:
             return self.display_text(f"Model Type: {model_type}\n\n Awesome Plot Coming Soon!")
 
+        # Plugins (ConfusionMatrix) return a list of property values, the figure is the first one
+        figure = model_plot.update_properties(model, inference_run=inference_run)
+        return figure[0] if isinstance(figure, list) else figure
+
 
 if __name__ == "__main__":
     # This class takes in model details and generates a Confusion Matrix
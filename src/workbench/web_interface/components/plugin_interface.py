@@ -1,6 +1,7 @@
 from abc import abstractmethod
 import inspect
-from typing import Union, Tuple, get_args, get_origin
+from functools import lru_cache
+from typing import Dict, Union, Tuple, get_args, get_origin
 from enum import Enum
 import logging
 from dash.development.base_component import Component
@@ -10,6 +11,15 @@ from workbench.web_interface.components.component_interface import ComponentInte
 
 log = logging.getLogger("workbench")
 
+# Results of the PluginInterface subclass checks (plugin classes don't change once they're loaded)
+_SUBCLASS_CACHE: Dict[type, bool] = {}
+
+
+@lru_cache(maxsize=None)
+def _expected_arg_types(base_class_method) -> tuple:
+    """Internal: The annotated argument types of a base class method (computed once per method)"""
+    return tuple(v for k, v in base_class_method.__annotations__.items() if k != "return" and k != "self")
+
 
 class PluginPage(Enum):
     """Plugin Page: Specify which page will AUTO load the plugin (CUSTOM/NONE = Don't autoload)"""
@@ -97,37 +107,46 @@ class PluginInterface(ComponentInterface):
     @classmethod
     def __subclasshook__(cls, subclass) -> Union[bool, type(NotImplemented)]:
         if cls is PluginInterface:
-            # Check if the subclass has all the required attributes
-            if not all(hasattr(subclass, attr) for attr in ("auto_load_page", "plugin_input_type")):
-                log.error(f"Missing required attributes in {subclass.__name__}")
+            result = _SUBCLASS_CACHE.get(subclass)
+            if result is None:
+                result = _SUBCLASS_CACHE[subclass] = cls._check_subclass(subclass)
+            return result
+        return NotImplemented
+
+    @classmethod
+    def _check_subclass(cls, subclass) -> bool:
+        """Internal: Check that a subclass has all required attributes, methods, and signatures"""
+
+        # Check if the subclass has all the required attributes
+        if not all(hasattr(subclass, attr) for attr in ("auto_load_page", "plugin_input_type")):
+            log.error(f"Missing required attributes in {subclass.__name__}")
+            return False
+
+        # Check if the subclass has all the required methods with correct signatures
+        required_methods = set(cls.__abstractmethods__)
+        for method in required_methods:
+            # Check for the presence of the method
+            if not hasattr(subclass, method):
+                log.error(f"Missing required method: {method} in {subclass.__name__}")
                 return False
 
-            # Check if the subclass has all the required methods with correct signatures
-            required_methods = set(cls.__abstractmethods__)
-            for method in required_methods:
-                # Check for the presence of the method
-                if not hasattr(subclass, method):
-                    log.error(f"Missing required method: {method} in {subclass.__name__}")
-                    return False
-
-                # Check if the method is implemented by the subclass itself
-                subclass_method = getattr(subclass, method)
-                if subclass_method.__qualname__.split(".")[0] != subclass.__name__:
-                    log.error(f"Method {method} is not implemented by {subclass.__name__}")
-                    return False
-
-                # Check argument types and return type
-                base_class_method = getattr(cls, method)
-                arg_type_error = cls._check_argument_types(base_class_method, subclass_method)
-                return_type_error = cls._check_return_type(base_class_method, subclass_method)
-                if arg_type_error or return_type_error:
-                    log.error(arg_type_error)
-                    log.error(return_type_error)
-                    return False
-
-            # If all checks pass, return True
-            return True
-        return NotImplemented
+            # Check if the method is implemented by the subclass itself
+            subclass_method = getattr(subclass, method)
+            if subclass_method.__qualname__.split(".")[0] != subclass.__name__:
+                log.error(f"Method {method} is not implemented by {subclass.__name__}")
+                return False
+
+            # Check argument types and return type
+            base_class_method = getattr(cls, method)
+            arg_type_error = cls._check_argument_types(base_class_method, subclass_method)
+            return_type_error = cls._check_return_type(base_class_method, subclass_method)
+            if arg_type_error or return_type_error:
+                log.error(arg_type_error)
+                log.error(return_type_error)
+                return False
+
+        # If all checks pass, return True
+        return True
 
     # Return detailed validation information
     @classmethod
@@ -182,7 +201,7 @@ class PluginInterface(ComponentInterface):
     @classmethod
     def _check_argument_types(cls, base_class_method, subclass_method) -> Union[None, str]:
         """Check that argument types match between base class and subclass methods."""
-        expected_arg_types = [v for k, v in base_class_method.__annotations__.items() if k != "return" and k != "self"]
+        expected_arg_types = _expected_arg_types(base_class_method)
         actual_arg_types = [
             param.annotation for param in inspect.signature(subclass_method).parameters.values() if param.name != "self"
         ]
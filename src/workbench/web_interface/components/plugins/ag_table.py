@@ -6,7 +6,7 @@ from dash_ag_grid import AgGrid
 
 # Workbench Imports
 from workbench.web_interface.components.plugin_interface import PluginInterface, PluginPage, PluginInputType
-from workbench.utils.symbols import tag_symbols
+from workbench.utils.symbols import health_symbols
 
 # Get the Workbench logger
 log = logging.getLogger("workbench")
@@ -65,7 +65,7 @@ class AGTable(PluginInterface):
 
         # Add Health Symbols
         if "Health" in table_df.columns:
-            table_df["Health"] = table_df["Health"].map(lambda x: tag_symbols(x))
+            table_df["Health"] = health_symbols(table_df["Health"])
 
         # Convert the DataFrame to a list of dictionaries for AG Grid
         table_data = table_df.to_dict("records")
@@ -1,14 +1,92 @@
 """A confusion matrix plugin component"""
 
-from dash import dcc, callback, Output, Input, State
+from dash import dcc, clientside_callback, Output, Input, State
+import numpy as np
 import plotly.graph_objects as go
 
-
 # Workbench Imports
 from workbench.web_interface.components.plugin_interface import PluginInterface, PluginPage, PluginInputType
 from workbench.cached.cached_model import CachedModel
 from workbench.utils.theme_manager import ThemeManager
 
+# Fixed layout and axis settings for the confusion matrix figure
+_LAYOUT_KW = dict(
+    margin=dict(l=100, r=10, t=15, b=80),  # Custom margins
+    height=360,  # Fixed height for consistent layout
+    xaxis_title="Predicted",  # Add meaningful axis labels
+    yaxis_title="Actual",
+)
+_AXIS_KW = dict(
+    tickfont_size=14,  # Font size for tick labels
+    automargin=True,  # Automatically manage margins
+    title_standoff=10,  # Add space between axis title and labels
+    title_font={"size": 18},
+    showgrid=False,  # Hide gridlines
+)
+
+# Clientside (JavaScript) callback that highlights the clicked confusion matrix square
+#   - The heatmap labels are "label:index", the index gives the square's position
+_HIGHLIGHT_SQUARE_JS = """
+function(clickData, figure) {
+    if (!clickData || !clickData.points || !clickData.points.length) {
+        return window.dash_clientside.no_update;
+    }
+    const point = clickData.points[0];
+    const index = (label) => parseInt(String(label).split(":").pop(), 10);
+    const x = index(point.x);
+    const y = index(point.y);
+    const delta = 0.5;
+
+    // Clicking the already highlighted square doesn't change anything (skip the figure re-render)
+    const shapes = (figure.layout && figure.layout.shapes) || [];
+    if (shapes.length === 1 && shapes[0].x0 === x - delta && shapes[0].y0 === y - delta) {
+        return window.dash_clientside.no_update;
+    }
+    const highlight = {
+        type: "rect",
+        x0: x - delta,
+        x1: x + delta,
+        y0: y - delta,
+        y1: y + delta,
+        line: {color: "grey", width: 2},
+        layer: "above",
+    };
+    return {...figure, layout: {...figure.layout, shapes: [highlight]}};
+}
+"""
+
+
+def _cell_text(values: np.ndarray) -> np.ndarray:
+    """Internal: Format all the confusion matrix cell values in one vectorized pass
+
+    Args:
+        values (np.ndarray): The 2D array of confusion matrix values
+
+    Returns:
+        np.ndarray: A 2D array of display strings (floats with 2 decimals, everything else via str)
+    """
+    if np.issubdtype(values.dtype, np.floating):
+        return np.char.mod("%.2f", values)
+    if values.dtype != object:
+        return values.astype(str)
+    return np.array([[f"{v:.2f}" if isinstance(v, float) else str(v) for v in row] for row in values])
+
+
+def _compact_values(values: np.ndarray) -> np.ndarray:
+    """Internal: Cast the confusion matrix values to the smallest sufficient dtype (smaller figure JSON)
+
+    Args:
+        values (np.ndarray): The 2D array of confusion matrix values
+
+    Returns:
+        np.ndarray: The values as int32 (counts) or float32 (everything else numeric)
+    """
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int32)
+    if np.issubdtype(values.dtype, np.floating):
+        return values.astype(np.float32)
+    return values
+
 
 class ConfusionMatrix(PluginInterface):
     """Confusion Matrix Component"""
@@ -69,70 +147,40 @@ class ConfusionMatrix(PluginInterface):
         # from plotly.colors import sequential
         # color_scale = sequential.Plasma
 
-        # The confusion matrix is displayed in reverse order (flip the dataframe for correct orientation)
-        df = df.iloc[::-1]
+        # Pull the values and labels out of the DataFrame once (plain ndarrays, no pandas indexing overhead)
+        values = df.to_numpy()
+        columns = df.columns.to_numpy()
+        rows = df.index.to_numpy()
 
         # Add labels to the confusion matrix, including the index for highlighting
-        x_labels = [f"{c}:{i}" for i, c in enumerate(df.columns)]
-        y_labels = [f"{c}:{i}" for i, c in enumerate(df.index)]
+        x_labels = [f"{c}:{i}" for i, c in enumerate(columns)]
+        y_labels = [f"{r}:{i}" for i, r in enumerate(rows)]
 
-        # Create the heatmap figure
+        # Create the heatmap figure (the cell values are drawn by the heatmap's text, no per-cell annotations)
         colorscale = self.theme_manager.colorscale()
         colorscale = self.theme_manager.adjust_colorscale_alpha(colorscale, alpha=0.5)
         fig = go.Figure(
             data=go.Heatmap(
-                z=df,
+                z=_compact_values(values),
                 x=x_labels,
                 y=y_labels,
                 xgap=3,  # Add space between cells
                 ygap=3,
                 colorscale=colorscale,  # Use the current theme's colorscale
+                text=_cell_text(values),
+                texttemplate="%{text}",
+                textfont={"size": 16},
             )
         )
 
-        # Apply theme-based layout updates
-        fig.update_layout(
-            margin=dict(l=100, r=10, t=15, b=80),  # Custom margins
-            height=360,  # Fixed height for consistent layout
-            xaxis_title="Predicted",  # Add meaningful axis labels
-            yaxis_title="Actual",
-        )
-
-        # Configure x-axis
-        fig.update_xaxes(
-            tickvals=x_labels,  # Position ticks for each label
-            ticktext=df.columns,  # Display readable column names
-            tickangle=30,  # Rotate labels for better readability
-            tickfont_size=14,  # Font size for tick labels
-            automargin=True,  # Automatically manage margins
-            title_standoff=10,  # Add space between axis title and labels
-            title_font={"size": 18},
-            showgrid=False,  # Hide gridlines
-        )
+        # Apply the layout updates in a single pass
+        fig.update_layout(**_LAYOUT_KW)
 
-        # Configure y-axis
-        fig.update_yaxes(
-            tickvals=y_labels,  # Position ticks for each label
-            ticktext=df.index,  # Display readable row names
-            tickfont_size=14,  # Font size for tick labels
-            automargin=True,  # Automatically manage margins
-            title_standoff=10,  # Add space between axis title and labels
-            title_font={"size": 18},
-            showgrid=False,  # Hide gridlines
-        )
+        # Configure x-axis (ticks for each label, readable column names, rotated for readability)
+        fig.update_xaxes(tickvals=x_labels, ticktext=columns, tickangle=30, **_AXIS_KW)
 
-        # Add annotations for each cell in the confusion matrix
-        for i, row in enumerate(df.index):
-            for j, col in enumerate(df.columns):
-                value = df.loc[row, col]
-                text_value = f"{value:.2f}" if isinstance(value, float) else str(value)
-                fig.add_annotation(
-                    x=j,  # Cell column position
-                    y=i,  # Cell row position
-                    text=text_value,  # Display the value in the cell
-                    showarrow=False,  # No arrows, place directly in the cell
-                    font_size=16,  # Font size for cell values
-                )
+        # Configure y-axis (ticks for each label, readable row names, reversed so the first row is on top)
+        fig.update_yaxes(tickvals=y_labels, ticktext=rows, autorange="reversed", **_AXIS_KW)
 
         # Return the updated figure wrapped in a list
         return [fig]
@@ -140,43 +188,14 @@ class ConfusionMatrix(PluginInterface):
     def register_internal_callbacks(self):
         """Register internal callbacks for the plugin."""
 
-        @callback(
+        # Highlighting the clicked square is a pure UI update, so it runs in the browser (no server round trip)
+        clientside_callback(
+            _HIGHLIGHT_SQUARE_JS,
             Output(self.component_id, "figure", allow_duplicate=True),
             Input(self.component_id, "clickData"),
             State(self.component_id, "figure"),
             prevent_initial_call=True,
         )
-        def highlight_cm_square(click_data, current_figure):
-            """Highlight the selected confusion matrix square."""
-            if not click_data or "points" not in click_data:
-                return current_figure  # No click data, return the current figure
-
-            # Extract clicked point
-            point = click_data["points"][0]
-            x_index = point["x"]
-            y_index = point["y"]
-
-            # Parse the index from labels (e.g., "label:1")
-            x_label, x_idx = x_index.split(":")
-            y_label, y_idx = y_index.split(":")
-            x_idx, y_idx = int(x_idx), int(y_idx)
-
-            # Create a new rectangle for highlighting
-            delta = 0.5
-            highlight_shape = {
-                "type": "rect",
-                "x0": x_idx - delta,
-                "x1": x_idx + delta,
-                "y0": y_idx - delta,
-                "y1": y_idx + delta,
-                "line": {"color": "grey", "width": 2},
-                "layer": "above",
-            }
-
-            # Add the highlight
-            current_figure["layout"]["shapes"] = [highlight_shape]
-
-            return current_figure
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from typing import Union
 import logging
+import re
 
 # Dash Imports
 from dash import html, dcc
@@ -13,6 +14,39 @@ from workbench.web_interface.components.plugin_interface import PluginInterface,
 # Get the Workbench logger
 log = logging.getLogger("workbench")
 
+# Column types that get numeric (min/max/zeros) details
+_NUMERIC_TYPES = frozenset({"tinyint", "smallint", "int", "bigint", "float", "double", "decimal"})
+_FLOAT_TYPES = frozenset({"float", "double", "decimal"})
+
+# Template placeholders look like <<key>>
+_PLACEHOLDER_RE = re.compile(r"<<(\w+)>>")
+
+
+def _detail_string(value) -> str:
+    """Internal: Display string for a detail value (ISO dates get cleaned up)"""
+    if isinstance(value, str) and ".000Z" in value:
+        value = value.replace(".000Z", "").replace("T", " ")
+    return str(value)
+
+
+def _fill_template(template: str, values: dict, to_string=str) -> str:
+    """Internal: Replace all the <<key>> placeholders in a single regex pass
+
+    Args:
+        template (str): The template string with <<key>> placeholders
+        values (dict): The values for the placeholders (only referenced keys are converted to strings)
+        to_string (callable): Function used to convert a value to a string (default: str)
+
+    Returns:
+        str: The filled in template (placeholders without a value are left as-is)
+    """
+
+    def _replace(match: re.Match) -> str:
+        key = match.group(1)
+        return to_string(values[key]) if key in values else match.group(0)
+
+    return _PLACEHOLDER_RE.sub(_replace, template)
+
 
 class DataDetails(PluginInterface):
     """DataSource/FeatureSet Details Component"""
@@ -102,32 +136,12 @@ class DataDetails(PluginInterface):
         if not data_details:
             return "No data source details found"
 
-        # Loop through all the details and replace in the template
-        for key, value in data_details.items():
-            # Hack for dates
-            if ".000Z" in str(value):
-                try:
-                    value = value.replace(".000Z", "").replace("T", " ")
-                except AttributeError:
-                    pass
-            markdown_template = markdown_template.replace(f"<<{key}>>", str(value))
-
         # Fill in numeric column details
         column_stats = data_details.get("column_stats", {})
         numeric_column_details = ""
-        numeric_types = [
-            "tinyint",
-            "smallint",
-            "int",
-            "bigint",
-            "float",
-            "double",
-            "decimal",
-        ]
         for column_name, column_info in column_stats.items():
-            if column_info["dtype"] in numeric_types:
+            if column_info["dtype"] in _NUMERIC_TYPES:
                 column_html = self._column_info_html(column_name, column_info)
-                column_details = expanding_list.replace("<<column_info>>", column_html)
 
                 # Populate the bullet list (descriptive_stats and unique)
                 bullet_list = ""
@@ -138,28 +152,25 @@ class DataDetails(PluginInterface):
                 # Add correlations if they exist
                 if column_info.get("correlations"):
                     corr_title = """<span class="green-text"><b>Correlated Columns</b></span>"""
-                    corr_details = expanding_list.replace("<<column_info>>", corr_title)
-                    corr_details = f"""<li class="no-bullet">{corr_details}</li>"""
                     corr_list = ""
                     for col, corr in column_info["correlations"].items():
                         corr_list += f"<li>{col}: {corr:.3f}</li>"
-                    corr_details = corr_details.replace("<<bullet_list>>", corr_list)
-                    bullet_list += corr_details
+                    corr_details = _fill_template(expanding_list, {"column_info": corr_title, "bullet_list": corr_list})
+                    bullet_list += f"""<li class="no-bullet">{corr_details}</li>"""
 
-                # Add the bullet list to the column details
-                column_details = column_details.replace("<<bullet_list>>", bullet_list)
+                # Fill in the column info and the bullet list
+                column_details = _fill_template(
+                    expanding_list, {"column_info": column_html, "bullet_list": bullet_list}
+                )
 
                 # Add the column details to the markdown
                 numeric_column_details += column_details
 
-        # Now actually replace the column details in the markdown
-        markdown_template = markdown_template.replace("<<numeric_column_details>>", numeric_column_details)
-
         # For string columns create collapsible sections that show value counts
         string_column_details = ""
         for column_name, column_info in column_stats.items():
             # Skipping any columns that are numeric
-            if column_info["dtype"] in numeric_types:
+            if column_info["dtype"] in _NUMERIC_TYPES:
                 continue
 
             # Skipping any columns that are dates/timestamps
@@ -168,7 +179,6 @@ class DataDetails(PluginInterface):
 
             # Create the column info
             column_html = self._column_info_html(column_name, column_info)
-            column_details = expanding_list.replace("<<column_info>>", column_html)
 
             # Populate the bullet list (if we have value counts)
             if "value_counts" not in column_info:
@@ -178,15 +188,19 @@ class DataDetails(PluginInterface):
                 for value, count in column_info["value_counts"].items():
                     bullet_list += f"<li>{value}: {count}</li>"
 
-            # Add the bullet list to the column details
-            column_details = column_details.replace("<<bullet_list>>", bullet_list)
+            # Fill in the column info and the bullet list
+            column_details = _fill_template(expanding_list, {"column_info": column_html, "bullet_list": bullet_list})
 
             # Add the column details to the markdown
             string_column_details += column_details
 
-        # Now actually replace the column details in the markdown
-        markdown = markdown_template.replace("<<string_column_details>>", string_column_details)
-        return markdown
+        # Now fill in all the details (and the column details) in a single pass
+        markdown = _fill_template(markdown_template, data_details, to_string=_detail_string)
+        column_details = {
+            "numeric_column_details": numeric_column_details,
+            "string_column_details": string_column_details,
+        }
+        return _fill_template(markdown, column_details)
 
     @staticmethod
     def _construct_full_type(column_info: dict) -> dict:
@@ -218,21 +232,11 @@ class DataDetails(PluginInterface):
         html_template = """<b><<name>></b> <span class="blue-text">(<<full_type>>)</span>:"""
 
         # Add min, max, and number of zeros for numeric columns
-        numeric_types = [
-            "tinyint",
-            "smallint",
-            "int",
-            "bigint",
-            "float",
-            "double",
-            "decimal",
-        ]
-        float_types = ["float", "double", "decimal"]
-        if column_info["dtype"] in numeric_types:
+        if column_info["dtype"] in _NUMERIC_TYPES:
             # Just hardcode the min and max for now
             min = column_info["descriptive_stats"]["min"]
             max = column_info["descriptive_stats"]["max"]
-            if column_info["dtype"] in float_types:
+            if column_info["dtype"] in _FLOAT_TYPES:
                 html_template += f""" {min:.2f} → {max:.2f}&nbsp;&nbsp;&nbsp;&nbsp;"""
             else:
                 html_template += f""" {int(min)} → {int(max)}&nbsp;&nbsp;&nbsp;&nbsp;"""
@@ -249,17 +253,18 @@ class DataDetails(PluginInterface):
         if column_info["nulls"] > 0:
             html_template += """ <span class="red-text">Null: <<nulls>></span>"""
 
-        # Replace the column name
-        html_template = html_template.replace("<<name>>", column_name)
-
         # Construct the full type
         column_info = self._construct_full_type(column_info)
 
-        # Loop through all the details and replace in the template
-        for key, value in column_info.items():
-            html_template = html_template.replace(f"<<{key}>>", str(value))
-
-        return html_template
+        # Fill in just the fields the column template uses (in a single pass)
+        fields = {
+            "name": column_name,
+            "full_type": column_info["full_type"],
+            "num_zeros": column_info.get("num_zeros"),
+            "unique": column_info.get("unique"),
+            "nulls": column_info["nulls"],
+        }
+        return _fill_template(html_template, fields)
 
 
 if __name__ == "__main__":
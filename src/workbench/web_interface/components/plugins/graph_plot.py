@@ -1,14 +1,20 @@
+from collections import OrderedDict
 from typing import Union
 from dash import dcc, html, callback, Input, Output
 import plotly.graph_objects as go
 from dash.exceptions import PreventUpdate
 import networkx as nx
+import numpy as np
 
 # Workbench Imports
 from workbench.core.artifacts.graph_core import GraphCore
 from workbench.web_interface.components.plugin_interface import PluginInterface, PluginPage, PluginInputType
 from workbench.utils.theme_manager import ThemeManager
 
+# Spring layouts are expensive (500 iterations), so we keep the most recent ones around
+_LAYOUT_CACHE = OrderedDict()
+_LAYOUT_CACHE_SIZE = 16
+
 
 class GraphPlot(PluginInterface):
     """A Graph Plot Plugin for NetworkX Graphs."""
@@ -118,9 +124,7 @@ class GraphPlot(PluginInterface):
 
         # Check to make sure the first node has a 'pos' attribute
         if "pos" not in first_node:
-            self.log.important("No 'pos' attribute found, running spring layout for node positions...")
-            pos = nx.spring_layout(self.graph, iterations=500)
-            nx.set_node_attributes(self.graph, pos, "pos")
+            nx.set_node_attributes(self.graph, self.spring_layout(self.graph), "pos")
 
         # Use 'id' as default label field if not specified
         label_field = kwargs.get("label", next(iter(first_node), "id"))
@@ -163,24 +167,29 @@ class GraphPlot(PluginInterface):
             ),
         )
 
-        # Create Scattergl traces for edges in a single loop for efficiency
-        edge_traces = []
-        for edge in self.graph.edges():
-            x0, y0 = self.graph.nodes[edge[0]]["pos"]
-            x1, y1 = self.graph.nodes[edge[1]]["pos"]
+        # Create Scattergl traces for edges, one trace per (rounded) edge weight since the styling
+        # depends on the weight. Each trace holds all its edges as [x0, x1, NaN, ...] line segments
+        node_index = {node: i for i, node in enumerate(self.graph.nodes())}
+        node_pos = np.column_stack([x_nodes, y_nodes]).astype(float)
+        edges = list(self.graph.edges(data="weight", default=0.5))
+        src = np.fromiter((node_index[u] for u, _, _ in edges), dtype=int, count=len(edges))
+        dst = np.fromiter((node_index[v] for _, v, _ in edges), dtype=int, count=len(edges))
+        weights = np.round(np.fromiter((w for _, _, w in edges), dtype=float, count=len(edges)), 2)
 
-            # Check for edge weight and set defaults if not present
-            weight = self.graph.edges[edge].get("weight", 0.5)
+        edge_traces = []
+        for weight in np.unique(weights):
+            mask = weights == weight
+            segments = np.full((3 * mask.sum(), 2), np.nan)
+            segments[0::3] = node_pos[src[mask]]
+            segments[1::3] = node_pos[dst[mask]]
 
             # Scale the width and alpha of the edge based on the weight
             width = min(5.0, weight * 4.9 + 0.1)  # Scale edge width to range [0.1, 5.0]
             alpha = min(1.0, weight * 0.9 + 0.1)  # Scale alpha to range [0.1, 1.0]
-
-            # Create individual Scattergl trace for each edge with specific styling
             edge_traces.append(
                 go.Scattergl(
-                    x=[x0, x1],
-                    y=[y0, y1],
+                    x=segments[:, 0],
+                    y=segments[:, 1],
                     mode="lines",
                     line=dict(width=width, color=f"rgba(150, 150, 150, {alpha})"),  # Set edge color and transparency
                     showlegend=False,
@@ -226,6 +235,29 @@ class GraphPlot(PluginInterface):
         # Return the updated properties for the dropdowns and the figure
         return [self.graph_figure, label_list, color_list, default_label, default_color]
 
+    def spring_layout(self, graph: nx.Graph) -> dict:
+        """Compute (or reuse) a spring layout for the graph, keyed by the graph structure
+
+        Args:
+            graph (nx.Graph): The NetworkX graph
+
+        Returns:
+            dict: A dictionary of node positions {node: (x, y)}
+        """
+        key = (graph.name, tuple(graph.nodes()), tuple(graph.edges()))
+        pos = _LAYOUT_CACHE.get(key)
+        if pos is not None:
+            _LAYOUT_CACHE.move_to_end(key)
+            return pos
+
+        # Fixed seed so the same graph always gets the same layout
+        self.log.important("No 'pos' attribute found, running spring layout for node positions...")
+        pos = nx.spring_layout(graph, iterations=500, seed=42)
+        _LAYOUT_CACHE[key] = pos
+        if len(_LAYOUT_CACHE) > _LAYOUT_CACHE_SIZE:
+            _LAYOUT_CACHE.popitem(last=False)
+        return pos
+
     def register_internal_callbacks(self):
         """Register any internal callbacks for the plugin."""
 
@@ -3,18 +3,108 @@
 import logging
 from typing import Union
 
-
 # Dash Imports
-from dash import html, callback, dcc, Input, Output, State
+from dash import html, callback, clientside_callback, dcc, Input, Output, State
 
 # Workbench Imports
 from workbench.cached.cached_model import CachedModel
-from workbench.utils.markdown_utils import health_tag_markdown
+from workbench.utils.markdown_utils import health_tag_markdown, df_to_markdown
 from workbench.web_interface.components.plugin_interface import PluginInterface, PluginPage, PluginInputType
 
 # Get the Workbench logger
 log = logging.getLogger("workbench")
 
+# Clientside debounce/guard for the inference run dropdown
+#   - A new selection cancels any pending one, so fast flips only send the final selection to the server
+#   - Selections that match the inference run already shown are never sent
+_NEW_RUN_JS = """
+function(inference_run, shown_run) {
+    const pending = (window.workbenchDebounce = window.workbenchDebounce || {});
+    const key = "__COMPONENT_ID__";
+    if (pending[key]) {
+        clearTimeout(pending[key].timer);
+        pending[key].resolve(window.dash_clientside.no_update);
+        delete pending[key];
+    }
+    if (inference_run === shown_run) {
+        return window.dash_clientside.no_update;
+    }
+    return new Promise((resolve) => {
+        const timer = setTimeout(() => {
+            delete pending[key];
+            resolve(inference_run);
+        }, __DEBOUNCE_MS__);
+        pending[key] = {timer: timer, resolve: resolve};
+    });
+}
+"""
+_DEBOUNCE_MS = 200
+
+
+def _truncated_join(values: list[str], max_chars: int = 100) -> str:
+    """Internal: Same as ', '.join(values)[:max_chars] but only joins enough values to fill max_chars
+
+    Args:
+        values (list[str]): The values to join
+        max_chars (int): The maximum number of characters to return (default: 100)
+
+    Returns:
+        str: The comma-separated values, truncated to max_chars
+    """
+    parts = []
+    length = -2  # The first value doesn't get a separator
+    for value in values:
+        parts.append(value)
+        length += len(value) + 2
+        if length >= max_chars:
+            break
+    return ", ".join(parts)[:max_chars]
+
+
+def _health_tags_markdown(summary: dict) -> str:
+    """Internal: Markdown for the model health tags"""
+    return health_tag_markdown(summary.get("health_tags", []))
+
+
+def _features_markdown(summary: dict) -> str:
+    """Internal: Markdown for the model features (count and a truncated list)"""
+    features = summary.get("workbench_model_features", [])
+    return f"**features:** ({len(features)}) {_truncated_join(features)}...  \n"
+
+
+def _field_markdown(key: str):
+    """Internal: Create a markdown renderer for a model summary field
+
+    Args:
+        key (str): The summary field (the display label has the "workbench_" prefix chopped off)
+
+    Returns:
+        callable: A function that takes the model summary and returns the markdown line for this field
+    """
+    label = key.replace("workbench_", "")
+
+    def _render(summary: dict) -> str:
+        value = summary.get(key, "-")
+
+        # If the value is a list, convert it to a comma-separated string
+        if isinstance(value, list):
+            value = ", ".join(value)
+        return f"**{label}:** {value}  \n"
+
+    return _render
+
+
+# Markdown renderers for the model summary fields (in display order)
+_SUMMARY_RENDERERS = (
+    _health_tags_markdown,
+    _field_markdown("input"),
+    _field_markdown("workbench_registered_endpoints"),
+    _field_markdown("workbench_model_type"),
+    _field_markdown("workbench_tags"),
+    _field_markdown("workbench_model_target"),
+    _features_markdown,
+)
+
 
 class ModelDetails(PluginInterface):
     """Model Details Composite Component"""
@@ -47,6 +137,8 @@ class ModelDetails(PluginInterface):
                 html.H3(children="Inference Metrics"),
                 dcc.Dropdown(id=f"{self.component_id}-dropdown", className="dropdown"),
                 dcc.Markdown(id=f"{self.component_id}-metrics"),
+                dcc.Store(id=f"{self.component_id}-shown-run"),
+                dcc.Store(id=f"{self.component_id}-selected-run"),
             ],
         )
 
@@ -57,6 +149,7 @@ class ModelDetails(PluginInterface):
             (f"{self.component_id}-dropdown", "options"),
             (f"{self.component_id}-dropdown", "value"),
             (f"{self.component_id}-metrics", "children"),
+            (f"{self.component_id}-shown-run", "data"),
         ]
         self.signals = [(f"{self.component_id}-dropdown", "value")]
 
@@ -85,22 +178,35 @@ class ModelDetails(PluginInterface):
         metrics = self.inference_metrics(default_run)
 
         # Return the updated property values for the plugin
-        return [header, details, inference_runs, default_run, metrics]
+        return [header, details, inference_runs, default_run, metrics, default_run]
 
     def register_internal_callbacks(self):
+        # Setting the dropdown in update_properties would trigger a second (duplicate) metrics render on the
+        # server, so the browser only forwards a (debounced) selection when it differs from the run already shown
+        new_run_js = _NEW_RUN_JS.replace("__COMPONENT_ID__", self.component_id)
+        clientside_callback(
+            new_run_js.replace("__DEBOUNCE_MS__", str(_DEBOUNCE_MS)),
+            Output(f"{self.component_id}-selected-run", "data"),
+            Input(f"{self.component_id}-dropdown", "value"),
+            State(f"{self.component_id}-shown-run", "data"),
+            prevent_initial_call=True,
+        )
+
         @callback(
             Output(f"{self.component_id}-metrics", "children", allow_duplicate=True),
-            Input(f"{self.component_id}-dropdown", "value"),
+            Output(f"{self.component_id}-shown-run", "data", allow_duplicate=True),
+            Input(f"{self.component_id}-selected-run", "data"),
             State(f"{self.component_id}-header", "children"),
             prevent_initial_call=True,
         )
         def update_inference_run(inference_run, model_name):
-            # Suboptimal: We need to create the model object again
-            self.current_model = CachedModel(model_name)
+            # Reuse the model object if it's the same model (creating a CachedModel hits AWS)
+            if self.current_model is None or self.current_model.uuid != model_name:
+                self.current_model = CachedModel(model_name)
 
             # Update the model metrics
             metrics = self.inference_metrics(inference_run)
-            return metrics
+            return metrics, inference_run
 
     def model_summary(self):
         """Construct the markdown string for the model summary
@@ -109,49 +215,9 @@ class ModelDetails(PluginInterface):
             str: A markdown string
         """
 
-        # Get these fields from the model
-        show_fields = [
-            "health_tags",
-            "input",
-            "workbench_registered_endpoints",
-            "workbench_model_type",
-            "workbench_tags",
-            "workbench_model_target",
-            "workbench_model_features",
-        ]
-
         # Construct the markdown string
         summary = self.current_model.summary()
-        markdown = ""
-        for key in show_fields:
-
-            # Special case for the health tags
-            if key == "health_tags":
-                markdown += health_tag_markdown(summary.get(key, []))
-                continue
-
-            # Special case for the features
-            if key == "workbench_model_features":
-                value = summary.get(key, [])
-                key = "features"
-                value = f"({len(value)}) {', '.join(value)[:100]}..."
-                markdown += f"**{key}:** {value}  \n"
-                continue
-
-            # Get the value
-            value = summary.get(key, "-")
-
-            # If the value is a list, convert it to a comma-separated string
-            if isinstance(value, list):
-                value = ", ".join(value)
-
-            # Chop off the "workbench_" prefix
-            key = key.replace("workbench_", "")
-
-            # Add to markdown string
-            markdown += f"**{key}:** {value}  \n"
-
-        return markdown
+        return "".join(render(summary) for render in _SUMMARY_RENDERERS)
 
     def inference_metrics(self, inference_run: Union[str, None]) -> str:
         """Construct the markdown string for the model metrics
@@ -161,40 +227,46 @@ class ModelDetails(PluginInterface):
         Returns:
             str: A markdown string
         """
-        # Model Metrics
-        if self.current_model is None:
-            meta_df = None
+        # Grab the inference metadata and metrics together (fetched concurrently)
+        model = self.current_model
+        if model is not None and inference_run:
+            meta_df, metrics = model.get_inference_bundle(inference_run)
         else:
-            meta_df = self.current_model.get_inference_metadata(inference_run) if inference_run else None
+            meta_df = None
+            metrics = model.get_inference_metrics(capture_uuid=inference_run)
+
+        # Model Metrics
         if meta_df is None:
             test_data = "Inference Metadata Not Found"
             test_data_hash = " - "
             test_rows = " - "
             description = " - "
         else:
-            inference_meta = meta_df.to_dict(orient="records")[0]
+            # Only the first row is used, so just grab that row (instead of converting the whole frame)
+            inference_meta = meta_df.iloc[0]
             test_data = inference_meta.get("name", " - ")
             test_data_hash = inference_meta.get("data_hash", " - ")
             test_rows = inference_meta.get("num_rows", " - ")
             description = inference_meta.get("description", " - ")
 
         # Add the markdown for the model test metrics
-        markdown = "\n"
-        markdown += f"**Test Data:** {test_data}  \n"
-        markdown += f"**Data Hash:** {test_data_hash}  \n"
-        markdown += f"**Test Rows:** {test_rows}  \n"
-        markdown += f"**Description:** {description}  \n"
-
-        # Grab the Metrics from the model details
-        metrics = self.current_model.get_inference_metrics(capture_uuid=inference_run)
+        lines = [
+            "\n",
+            f"**Test Data:** {test_data}  \n",
+            f"**Data Hash:** {test_data_hash}  \n",
+            f"**Test Rows:** {test_rows}  \n",
+            f"**Description:** {description}  \n",
+        ]
+
+        # Add the metrics table
         if metrics is None:
-            markdown += "  \nNo Data  \n"
+            lines.append("  \nNo Data  \n")
         else:
-            markdown += "  \n"
-            metrics = metrics.round(3)
-            markdown += metrics.to_markdown(index=False)
+            lines.append("  \n")
+            lines.append(df_to_markdown(metrics.round(3)))
+        markdown = "".join(lines)
 
-        print(markdown)
+        log.debug("Inference Metrics Markdown:\n%s", markdown)
         return markdown
 
     def get_inference_runs(self):
@@ -94,14 +94,8 @@ class PipelineDetails(PluginInterface):
         Returns:
             str: A markdown string as a bulleted list.
         """
-        markdown = ""
-
         # Each pipeline will have Workbench Artifact keys (data_source, feature_set, model, etc.)
-        for key, value in pipeline_details.items():
-            uuid = value.get("name")
-            markdown += f"- {self._hyperlink(key, uuid)}\n"
-
-        return markdown
+        return "".join(f"- {self._hyperlink(key, value.get('name'))}\n" for key, value in pipeline_details.items())
 
     def _hyperlink(self, artifact_type: str, uuid: str) -> str:
         """Create a hyperlink for a Workbench artifact type and name.
@@ -129,24 +123,24 @@ class PipelineDetails(PluginInterface):
         Returns:
             str: A markdown string.
         """
-        markdown = ""
+        lines = []
         prefix = "  " * indent + "- "  # Use "- " for Markdown nested list items
+        item_prefix = "  " * (indent + 1) + "- "
 
         for key, value in dictionary.items():
             if isinstance(value, dict):
                 # Add the key as a parent item and recurse for nested dictionary
-                markdown += f"{prefix}**{key}:**\n"
-                markdown += self.dict_to_markdown(value, indent + 1)
+                lines.append(f"{prefix}**{key}:**\n")
+                lines.append(self._dict_to_markdown(value, indent + 1))
             elif isinstance(value, list):
                 # Add the key as a parent item, then each list item
-                markdown += f"{prefix}**{key}:**\n"
-                for item in value:
-                    markdown += f"{'  ' * (indent + 1)}- {item}\n"
+                lines.append(f"{prefix}**{key}:**\n")
+                lines.extend(f"{item_prefix}{item}\n" for item in value)
             else:
                 # Add a plain key-value pair
-                markdown += f"{prefix}**{key}:** {value}\n"
+                lines.append(f"{prefix}**{key}:** {value}\n")
 
-        return markdown
+        return "".join(lines)
 
 
 if __name__ == "__main__":
@@ -182,15 +182,19 @@ class ScatterPlot(PluginInterface):
             go.Figure: A Plotly Figure object.
         """
 
+        # Build the hover text from plain row tuples of just the hover columns (much faster than apply(axis=1))
+        #   Note: The column names are escaped so any braces in them aren't treated as format fields
+        hover_format = "<br>".join(col.replace("{", "{{").replace("}", "}}") + ": {}" for col in self.hover_columns)
+        hover_rows = df[self.hover_columns].itertuples(index=False, name=None)
+        hovertext = [hover_format.format(*row) for row in hover_rows]
+
         # Create an OpenGL Scatter Plot
         figure = go.Figure(
             data=go.Scattergl(
                 x=df[x_col],
                 y=df[y_col],
                 mode="markers",
-                hovertext=df.apply(
-                    lambda row: "<br>".join([f"{col}: {row[col]}" for col in self.hover_columns]), axis=1
-                ),
+                hovertext=hovertext,
                 hovertemplate="%{hovertext}<extra></extra>",  # Define hover template and remove extra info
                 textfont=dict(family="Arial Black", size=14),  # Set font size
                 marker=dict(
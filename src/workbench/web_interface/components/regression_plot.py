@@ -1,14 +1,28 @@
 """A Regression Plot component"""
 
 from dash import dcc
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 
 # Workbench Imports
 from workbench.web_interface.components.component_interface import ComponentInterface
 from workbench.api import Model
+from workbench.cached.cached_model import CachedModel
 from workbench.utils.theme_manager import ThemeManager
 
+# Inference metadata fields with the actual/prediction ranges (written when inference results are captured)
+_RANGE_FIELDS = ["actual_min", "actual_max", "pred_min", "pred_max"]
+
+# Fixed styling for the regression plot (applied to the data figure in one pass)
+_LAYOUT_KW = dict(
+    yaxis_title=dict(text="Prediction", font=dict(size=18)),
+    margin=dict(l=80, r=10, t=15, b=60),  # Custom margins
+    height=360,
+)
+_MARKER_STYLE = dict(size=14, line=dict(width=1, color="Black"))
+_DIAGONAL_LINE = dict(width=5, color="rgba(1.0, 1.0, 1.0, 0.5)")
+
 
 # This class is basically a specialized version of a Plotly Scatter Plot
 # For heatmaps see (https://plotly.com/python/line-and-scatter/)
@@ -38,49 +52,68 @@ class RegressionPlot(ComponentInterface):
         # Get the name of the actual field value column
         actual_col = [col for col in df.columns if col != "prediction"][0]
 
+        # Pull the columns out as NumPy arrays once (and don't add columns to the (cached) predictions DataFrame)
+        actual = df[actual_col].to_numpy(dtype=float)
+        prediction = df["prediction"].to_numpy(dtype=float)
+
         # Calculate the distance from the diagonal for each point
-        df["prediction_error"] = abs(df["prediction"] - df[actual_col])
+        prediction_error = np.abs(prediction - actual)
 
         # Create the scatter plot with bigger dots
         fig = px.scatter(
-            df,
-            x=actual_col,
-            y="prediction",
-            size="prediction_error",
+            x=actual,
+            y=prediction,
+            size=prediction_error,
             size_max=20,
-            color="prediction_error",
+            color=prediction_error,
             color_continuous_scale=self.theme_manager.colorscale(),
+            labels={"x": actual_col, "y": "prediction", "size": "prediction_error", "color": "prediction_error"},
+            render_mode="webgl",  # WebGL (Scattergl) handles thousands of points much better than SVG
         )
 
-        # Customize axis labels
-        fig.update_layout(
-            xaxis_title=dict(text=actual_col, font=dict(size=18)),
-            yaxis_title=dict(text="Prediction", font=dict(size=18)),
-        )
-
-        # Just fine-tuning the dots on the scatter plot
-        fig.update_traces(
-            marker=dict(size=14, line=dict(width=1, color="Black")),
-            selector=dict(mode="markers"),
-        )
+        # Apply the fixed styling (axis labels, margins, and dot size/outline)
+        fig.update_layout(xaxis_title=dict(text=actual_col, font=dict(size=18)), **_LAYOUT_KW)
+        fig.update_traces(marker=_MARKER_STYLE, selector=dict(mode="markers"))
 
         # Add a diagonal line for reference
-        min_val = min(df[actual_col].min(), df["prediction"].min())
-        max_val = max(df[actual_col].max(), df["prediction"].max())
+        min_val, max_val = self.plot_range(model, inference_run, actual, prediction)
         fig.add_shape(
             type="line",
-            line=dict(width=5, color="rgba(1.0, 1.0, 1.0, 0.5)"),
+            line=_DIAGONAL_LINE,
             x0=min_val,
             x1=max_val,
             y0=min_val,
             y1=max_val,
         )
 
-        # Just some fine-tuning of the plot
-        fig.update_layout(margin=dict(l=80, r=10, t=15, b=60), height=360)  # Custom margins
-
         return fig
 
+    @staticmethod
+    def plot_range(model: Model, inference_run: str, actual: np.ndarray, prediction: np.ndarray) -> tuple:
+        """Get the (min, max) range of the actual and prediction values
+
+        Args:
+            model (Model): Workbench Model object
+            inference_run (str): The inference run to get the range for
+            actual (np.ndarray): The actual (target) values
+            prediction (np.ndarray): The predicted values
+
+        Returns:
+            tuple: (min_value, max_value) from the inference metadata, or computed from the values
+        """
+        # The (cached) inference metadata is cheaper than scanning the values, but for a plain Model
+        # it's an S3 read, so only use it for CachedModels (and only if all four ranges are valid)
+        if isinstance(model, CachedModel):
+            meta = model.get_inference_metadata(inference_run)
+            if meta is not None and set(_RANGE_FIELDS).issubset(meta.columns):
+                ranges = np.asarray(meta[_RANGE_FIELDS].iloc[0], dtype=float)
+                if np.isfinite(ranges).all():
+                    actual_min, actual_max, pred_min, pred_max = ranges
+                    return min(actual_min, pred_min), max(actual_max, pred_max)
+
+        # Older inference runs (and model_training) don't have the ranges, so compute them
+        return min(np.nanmin(actual), np.nanmin(prediction)), max(np.nanmax(actual), np.nanmax(prediction))
+
 
 if __name__ == "__main__":
     # This class takes in model details and generates a Confusion Matrix
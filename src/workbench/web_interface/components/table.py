@@ -175,7 +175,7 @@ if __name__ == "__main__":
     columns = df.columns.to_list()
     df["Name"] = df.index
     df = df[["Name"] + columns]
-    df["Name"] = df["Name"].map(lambda x: f"<a href='https://www.google.com' target='_blank'>{x}</a>")
+    df["Name"] = "<a href='https://www.google.com' target='_blank'>" + df["Name"].astype(str) + "</a>"
 
     table_comp.columns = my_table.column_setup(df, markdown_columns=["Name"])
     table_comp.data = df.to_dict("records")
@@ -1,12 +1,13 @@
 """DataSourcesPageView pulls DataSource metadata from the AWS Service Broker with Details Panels on each DataSource"""
 
+import time
 import pandas as pd
 
 # Workbench Imports
 from workbench.web_interface.page_views.page_view import PageView
 from workbench.cached.cached_meta import CachedMeta
 from workbench.cached.cached_data_source import CachedDataSource
-from workbench.utils.symbols import tag_symbols
+from workbench.utils.symbols import health_symbols
 
 
 class DataSourcesPageView(PageView):
@@ -22,6 +23,10 @@ class DataSourcesPageView(PageView):
         self.data_sources_df = None
         self.refresh()
 
+        # Short-lived cache of DataSource objects (shared by the details and smart-sample callbacks)
+        self.data_source_cache = {}  # {uuid: (timestamp, CachedDataSource)}
+        self.data_source_ttl = 30  # seconds
+
     def refresh(self):
         """Refresh our list of DataSources from the Cloud Platform"""
         self.log.important("Calling refresh()..")
@@ -29,7 +34,7 @@ class DataSourcesPageView(PageView):
 
         # Add Health Symbols to the Model Group Name
         if "Health" in self.data_sources_df.columns:
-            self.data_sources_df["Health"] = self.data_sources_df["Health"].map(lambda x: tag_symbols(x))
+            self.data_sources_df["Health"] = health_symbols(self.data_sources_df["Health"])
 
     def data_sources(self) -> pd.DataFrame:
         """Get a list of all the DataSources
@@ -39,15 +44,14 @@ class DataSourcesPageView(PageView):
         """
         return self.data_sources_df
 
-    @staticmethod
-    def data_source_smart_sample(data_uuid: str) -> pd.DataFrame:
+    def data_source_smart_sample(self, data_uuid: str) -> pd.DataFrame:
         """Get a smart-sample dataframe (sample + outliers) for the given DataSource Index
         Args:
             data_uuid(str): The UUID of the DataSource
         Returns:
             pd.DataFrame: The smart-sample DataFrame
         """
-        ds = CachedDataSource(data_uuid)
+        ds = self._data_source(data_uuid)
         if not ds.exists():
             return pd.DataFrame({"uuid": [data_uuid], "status": ["NOT FOUND"]})
         if not ds.ready():
@@ -61,8 +65,7 @@ class DataSourcesPageView(PageView):
             # Return the Smart Sample (with the display subset of the columns)
             return smart_sample[[col for col in display_columns if col in smart_sample.columns]]
 
-    @staticmethod
-    def data_source_details(data_uuid: str) -> (dict, None):
+    def data_source_details(self, data_uuid: str) -> (dict, None):
         """Get all the details for the given DataSource UUID
         Args:
             data_uuid(str): The UUID of the DataSource
@@ -70,7 +73,7 @@ class DataSourcesPageView(PageView):
             dict: The details for the given DataSource (or None if not found)
         """
         # Grab the DataSource, if it exists and is ready
-        ds = CachedDataSource(data_uuid)
+        ds = self._data_source(data_uuid)
         if not ds.exists() or not ds.ready():
             return None
 
@@ -96,10 +99,29 @@ class DataSourcesPageView(PageView):
         # Return the Subset of DataSource Details
         return sub_details
 
+    def _data_source(self, data_uuid: str) -> CachedDataSource:
+        """Internal: Get the CachedDataSource for the given UUID, reusing a recently created one (TTL cache)
+        Args:
+            data_uuid(str): The UUID of the DataSource
+        Returns:
+            CachedDataSource: The CachedDataSource object
+        """
+        now = time.time()
+        cached = self.data_source_cache.get(data_uuid)
+        if cached and now - cached[0] < self.data_source_ttl:
+            return cached[1]
+
+        # Drop any expired entries and cache a new DataSource object
+        self.data_source_cache = {
+            uuid: entry for uuid, entry in self.data_source_cache.items() if now - entry[0] < self.data_source_ttl
+        }
+        ds = CachedDataSource(data_uuid)
+        self.data_source_cache[data_uuid] = (now, ds)
+        return ds
+
 
 if __name__ == "__main__":
     # Exercising the DataSourcesPageView
-    import time
     from pprint import pprint
 
     # Create the class and get the AWS DataSource details
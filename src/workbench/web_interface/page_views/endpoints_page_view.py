@@ -6,7 +6,7 @@ import pandas as pd
 from workbench.web_interface.page_views.page_view import PageView
 from workbench.cached.cached_meta import CachedMeta
 from workbench.cached.cached_endpoint import CachedEndpoint
-from workbench.utils.symbols import tag_symbols
+from workbench.utils.symbols import health_symbols
 
 
 class EndpointsPageView(PageView):
@@ -31,7 +31,7 @@ class EndpointsPageView(PageView):
         self.endpoints_df.drop(columns=["_aws_url"], inplace=True, errors="ignore")
         # Add Health Symbols to the Model Group Name
         if "Health" in self.endpoints_df.columns:
-            self.endpoints_df["Health"] = self.endpoints_df["Health"].map(lambda x: tag_symbols(x))
+            self.endpoints_df["Health"] = health_symbols(self.endpoints_df["Health"])
 
     def endpoints(self) -> pd.DataFrame:
         """Get all the data that's useful for this view
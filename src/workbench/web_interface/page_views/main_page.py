@@ -3,13 +3,16 @@
 import pandas as pd
 from typing import Optional, Tuple
 
-
 # Workbench Imports
 from workbench.web_interface.page_views.page_view import PageView
-from workbench.utils.symbols import tag_symbols
+from workbench.utils.symbols import health_symbols
 from workbench.cached.cached_meta import CachedMeta
 from workbench.utils.pandas_utils import dataframe_delta
 
+# Columns that we don't show in the summaries (frozensets for the per-column membership checks)
+_DROP_COLUMNS = frozenset({"_aws_url"})
+_MODEL_DROP_COLUMNS = frozenset({"Ver", "Status", "_aws_url"})
+
 
 class MainPage(PageView):
     def __init__(self):
@@ -30,20 +33,7 @@ class MainPage(PageView):
         Returns:
             pd.DataFrame: Summary data about the AWS Glue Jobs
         """
-
-        # We get the dataframe from our CachedMeta
-        s3_data_df = self.meta.incoming_data()
-
-        # We might get an empty dataframe
-        if s3_data_df.empty:
-            return s3_data_df
-
-        # Add a UUID column
-        s3_data_df["uuid"] = s3_data_df["Name"]
-
-        # Drop the AWS URL column and return the dataframe
-        s3_data_df.drop(columns=["_aws_url"], inplace=True, errors="ignore")
-        return s3_data_df
+        return self._finalize_summary(self.meta.incoming_data(), name_column="Name")
 
     def incoming_data_delta(self, previous_hash: str = None) -> Tuple[Optional[pd.DataFrame], str]:
         """Detect changes in the incoming data and return a new DataFrame if changed."""
@@ -55,20 +45,7 @@ class MainPage(PageView):
         Returns:
             pd.DataFrame: Summary data about the AWS Glue Jobs
         """
-
-        # We get the dataframe from our CachedMeta
-        glue_df = self.meta.etl_jobs()
-
-        # We might get an empty dataframe
-        if glue_df.empty:
-            return glue_df
-
-        # Add a UUID column
-        glue_df["uuid"] = glue_df["Name"]
-
-        # Drop the AWS URL column and return the dataframe
-        glue_df.drop(columns=["_aws_url"], inplace=True, errors="ignore")
-        return glue_df
+        return self._finalize_summary(self.meta.etl_jobs(), name_column="Name")
 
     def glue_jobs_delta(self, previous_hash: str = None) -> Tuple[Optional[pd.DataFrame], str]:
         """Detect changes in the AWS Glue Jobs and return a new DataFrame if changed."""
@@ -80,20 +57,7 @@ class MainPage(PageView):
         Returns:
             pd.DataFrame: Summary data about the Workbench DataSources
         """
-
-        # We get the dataframe from our CachedMeta
-        data_df = self.meta.data_sources()
-
-        # We might get an empty dataframe
-        if data_df.empty:
-            return data_df
-
-        # Add a UUID column
-        data_df["uuid"] = data_df["Name"]
-
-        # Drop the AWS URL column and return the dataframe
-        data_df.drop(columns=["_aws_url"], inplace=True, errors="ignore")
-        return data_df
+        return self._finalize_summary(self.meta.data_sources(), name_column="Name")
 
     def data_sources_delta(self, previous_hash: str = None) -> Tuple[Optional[pd.DataFrame], str]:
         """Detect changes in the Workbench DataSources and return a new DataFrame if changed."""
@@ -105,20 +69,7 @@ class MainPage(PageView):
         Returns:
             pd.DataFrame: Summary data about the Workbench FeatureSets
         """
-
-        # We get the dataframe from our CachedMeta
-        feature_df = self.meta.feature_sets(details=True)
-
-        # We might get an empty dataframe
-        if feature_df.empty:
-            return feature_df
-
-        # Add a UUID column
-        feature_df["uuid"] = feature_df["Feature Group"]
-
-        # Drop the AWS URL column and return the dataframe
-        feature_df.drop(columns=["_aws_url"], inplace=True, errors="ignore")
-        return feature_df
+        return self._finalize_summary(self.meta.feature_sets(details=True), name_column="Feature Group")
 
     def feature_sets_delta(self, previous_hash: str = None) -> tuple[Optional[pd.DataFrame], str]:
         """Detect changes in the Workbench FeatureSets and return a new DataFrame if changed."""
@@ -130,25 +81,10 @@ class MainPage(PageView):
         Returns:
             pd.DataFrame: Summary data about the Workbench Models
         """
-
-        # We get the dataframe from our CachedMeta and hyperlink the Model Group column
         model_df = self.meta.models(details=True)
-
-        # We might get an empty dataframe
-        if model_df.empty:
-            return model_df
-
-        # Add a UUID column
-        model_df["uuid"] = model_df["Model Group"]
-
-        # Drop some columns
-        model_df.drop(columns=["Ver", "Status", "_aws_url"], inplace=True, errors="ignore")
-
-        # Add Health Symbols to the Model Group Name
-        if "Health" in model_df.columns:
-            model_df["Health"] = model_df["Health"].map(lambda x: tag_symbols(x))
-
-        return model_df
+        return self._finalize_summary(
+            model_df, name_column="Model Group", drop_columns=_MODEL_DROP_COLUMNS, add_health=True
+        )
 
     def models_delta(self, previous_hash: str = None) -> Tuple[Optional[pd.DataFrame], str]:
         """Detect changes in the Workbench Models and return a new DataFrame if changed."""
@@ -160,29 +96,41 @@ class MainPage(PageView):
         Returns:
             pd.DataFrame: Summary data about the Workbench Endpoints
         """
+        return self._finalize_summary(self.meta.endpoints(), name_column="Name", add_health=True)
 
-        # We get the dataframe from our CachedMeta and hyperlink the Name column
-        endpoint_df = self.meta.endpoints()
-
-        # We might get an empty dataframe
-        if endpoint_df.empty:
-            return endpoint_df
-
-        # Add a UUID column
-        endpoint_df["uuid"] = endpoint_df["Name"]
+    def endpoints_delta(self, previous_hash: str = None) -> Tuple[Optional[pd.DataFrame], str]:
+        """Detect changes in the Workbench Endpoints and return a new DataFrame if changed."""
+        return dataframe_delta(self.endpoints_summary, previous_hash)
 
-        # Drop the AWS URL column
-        endpoint_df.drop(columns=["_aws_url"], inplace=True, errors="ignore")
+    @staticmethod
+    def _finalize_summary(
+        df: pd.DataFrame, name_column: str, drop_columns: frozenset = _DROP_COLUMNS, add_health: bool = False
+    ) -> pd.DataFrame:
+        """Internal: Build a summary DataFrame (uuid column, dropped columns, and health symbols)
 
-        # Add Health Symbols to the Endpoint Name
-        if "Health" in endpoint_df.columns:
-            endpoint_df["Health"] = endpoint_df["Health"].map(lambda x: tag_symbols(x))
+        Args:
+            df (pd.DataFrame): The (cached) metadata DataFrame, this DataFrame is not modified
+            name_column (str): The column to use for the uuid column
+            drop_columns (frozenset): Columns to leave out of the summary (default: {"_aws_url"})
+            add_health (bool): Convert the Health column to health symbols (default: False)
 
-        return endpoint_df
+        Returns:
+            pd.DataFrame: The summary DataFrame
+        """
 
-    def endpoints_delta(self, previous_hash: str = None) -> Tuple[Optional[pd.DataFrame], str]:
-        """Detect changes in the Workbench Endpoints and return a new DataFrame if changed."""
-        return dataframe_delta(self.endpoints_summary, previous_hash)
+        # We might get an empty dataframe
+        if df.empty:
+            return df
+
+        # Add a UUID column (and drop the given columns)
+        #   Note: Assigning the underlying array skips the index alignment of a Series assignment
+        keep_columns = [col for col in df.columns if col not in drop_columns]
+        summary_df = df[keep_columns].assign(uuid=df[name_column].to_numpy())
+
+        # Add Health Symbols
+        if add_health and "Health" in summary_df.columns:
+            summary_df["Health"] = health_symbols(summary_df["Health"])
+        return summary_df
 
 
 if __name__ == "__main__":
@@ -1,12 +1,14 @@
 """ModelsPageView pulls Model metadata from the AWS Service Broker with Details Panels on each Model"""
 
+import time
+import threading
 import pandas as pd
 
 # Workbench Imports
 from workbench.web_interface.page_views.page_view import PageView
 from workbench.cached.cached_meta import CachedMeta
 from workbench.cached.cached_model import CachedModel
-from workbench.utils.symbols import tag_symbols
+from workbench.utils.symbols import health_symbols
 
 
 class ModelsPageView(PageView):
@@ -18,21 +20,47 @@ class ModelsPageView(PageView):
         # CachedMeta object for Cloud Platform Metadata
         self.meta = CachedMeta()
 
-        # Initialize the Models DataFrame
+        # Short-lived cache of Model details (the details panel asks for the same model repeatedly)
+        self.model_details_cache = {}  # {uuid: (timestamp, details)}
+        self.model_details_ttl = 30  # seconds
+
+        # Initialize the Models DataFrame with the (fast) summary, then pull the (slow)
+        # per-model details in a background thread so the page doesn't block on them
         self.models_df = None
-        self.refresh()
+        self.details_ready = threading.Event()
+        self.refresh(details=False)
+        threading.Thread(target=self._load_details, daemon=True).start()
+
+    def _load_details(self):
+        """Internal: Background load of the model details (the regular refresh takes over after this)"""
+        try:
+            self.refresh()
+        except Exception as e:
+            self.log.error(f"Background load of model details failed: {e}")
+        finally:
+            # Always release the page so the regular (timed) refresh can take over
+            self.details_ready.set()
+
+    def refresh(self, details: bool = True):
+        """Refresh the model data from the Cloud Platform
 
-    def refresh(self):
-        """Refresh the model data from the Cloud Platform"""
-        self.log.important("Calling refresh()..")
-        self.models_df = self.meta.models(details=True)
+        Args:
+            details (bool): Include the per-model details (health, owner, etc) (default: True)
+        """
+        self.log.important(f"Calling refresh(details={details})..")
+        models_df = self.meta.models(details=details)
 
         # Drop some columns
-        self.models_df.drop(columns=["Ver", "Status", "_aws_url"], inplace=True, errors="ignore")
+        models_df = models_df.drop(columns=["Ver", "Status", "_aws_url"], errors="ignore")
 
         # Add Health Symbols to the Model Group Name
-        if "Health" in self.models_df.columns:
-            self.models_df["Health"] = self.models_df["Health"].map(lambda x: tag_symbols(x))
+        if "Health" in models_df.columns:
+            models_df["Health"] = health_symbols(models_df["Health"])
+
+        # Swap in the new DataFrame (readers never see a partially updated one)
+        self.models_df = models_df
+        if details:
+            self.details_ready.set()
 
     def models(self) -> pd.DataFrame:
         """Get all the data that's useful for this view
@@ -42,9 +70,29 @@ class ModelsPageView(PageView):
         """
         return self.models_df
 
-    @staticmethod
     def model_details(self, model_uuid: str) -> (dict, None):
-        """Get all the details for the given Model UUID
+        """Get all the details for the given Model UUID (cached for a short TTL)
+        Args:
+            model_uuid(str): The UUID of the Model
+        Returns:
+            dict: The details for the given Model (or None if not found)
+        """
+        now = time.time()
+        cached = self.model_details_cache.get(model_uuid)
+        if cached and now - cached[0] < self.model_details_ttl:
+            return cached[1]
+
+        # Drop any expired entries and cache the new Model Details
+        self.model_details_cache = {
+            uuid: entry for uuid, entry in self.model_details_cache.items() if now - entry[0] < self.model_details_ttl
+        }
+        details = self._model_details(model_uuid)
+        self.model_details_cache[model_uuid] = (now, details)
+        return details
+
+    @staticmethod
+    def _model_details(model_uuid: str) -> (dict, None):
+        """Internal: Pull the details for the given Model UUID
         Args:
             model_uuid(str): The UUID of the Model
         Returns:
@@ -62,7 +110,6 @@ class ModelsPageView(PageView):
 
 if __name__ == "__main__":
     # Exercising the ModelsPageView
-    import time
     from pprint import pprint
 
     # Create the class and get the AWS Model details
@@ -6,7 +6,7 @@ import pandas as pd
 from workbench.web_interface.page_views.page_view import PageView
 from workbench.cached.cached_meta import CachedMeta
 from workbench.cached.cached_pipeline import CachedPipeline
-from workbench.utils.symbols import tag_symbols
+from workbench.utils.symbols import health_symbols
 
 
 class PipelinesPageView(PageView):
@@ -31,7 +31,7 @@ class PipelinesPageView(PageView):
         self.pipelines_df.drop(columns=["_aws_url"], inplace=True, errors="ignore")
         # Add Health Symbols to the Model Group Name
         if "Health" in self.pipelines_df.columns:
-            self.pipelines_df["Health"] = self.pipelines_df["Health"].map(lambda x: tag_symbols(x))
+            self.pipelines_df["Health"] = health_symbols(self.pipelines_df["Health"])
 
     def pipelines(self) -> pd.DataFrame:
         """Get all the data that's useful for this view
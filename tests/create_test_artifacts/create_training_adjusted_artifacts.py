@@ -22,6 +22,18 @@ from workbench.core.transforms.model_to_endpoint.model_to_endpoint import ModelT
 log = logging.getLogger("workbench")
 
 
+def wait_until(check, timeout: float = 60, initial_wait: float = 0.5, max_wait: float = 5):
+    """Poll the check function (with backoff) until it returns True or we time out"""
+    wait = initial_wait
+    deadline = time.time() + timeout
+    while not check():
+        if time.time() > deadline:
+            log.warning(f"Timed out after {timeout} seconds...")
+            return
+        time.sleep(wait)
+        wait = min(wait * 1.5, max_wait)
+
+
 if __name__ == "__main__":
 
     # Get the path to the dataset in the repository data directory
@@ -45,7 +57,7 @@ if __name__ == "__main__":
             target_column="class_number_of_rings", description="Abalone Regression Model", train_all_data=True
         )
         log.info("Waiting for the Model to be created...")
-        time.sleep(10)
+        wait_until(lambda: ModelCore("abalone-regression-100").exists())
 
     # Create the abalone_regression Endpoint
     if recreate or not EndpointCore("abalone-regression-end-100").exists():
@@ -6,62 +6,54 @@ from workbench.api.feature_set import FeatureSet
 from workbench.api.model import Model
 from workbench.api.endpoint import Endpoint
 
+# The test artifacts, grouped by type (deleted Endpoints -> Models -> FeatureSets -> DataSources)
+TEST_ENDPOINTS = [
+    "abc",
+    "abc-2",
+    "abalone-regression-end",
+    "abalone-regression-end-rt",
+    "abalone-classification-end",
+    "wine-classification-end",
+    "aqsol-regression-end",
+    "aqsol-mol-regression-end",
+    "aqsol-mol-class-end",
+    "abalone-qr-end",
+    "aqsol-qr-end",
+    "abalone-knn-end",
+    "abalone-clusters-end",
+]
+TEST_MODELS = [
+    "abalone-regression",
+    "abalone-classification",
+    "wine-classification",
+    "aqsol-regression",
+    "aqsol-mol-regression",
+    "aqsol-mol-class",
+    "abalone-quantile-reg",
+    "aqsol-quantile-reg",
+    "abalone-knn-reg",
+    "abalone-clusters",
+    "wine-rfc-class",
+    "aqsol-knn-reg",
+]
+TEST_FEATURE_SETS = [
+    "test_features",
+    "abalone_features",
+    "abalone_classification",
+    "wine_features",
+    "aqsol_features",
+    "aqsol_mol_descriptors",
+]
+TEST_DATA_SOURCES = ["test_data", "abc", "abc_2", "abalone_data", "abalone_data_copy", "wine_data", "aqsol_data"]
 
-if __name__ == "__main__":
-
-    # Delete the test_data Artifacts
-    DataSource.managed_delete("test_data")
-    DataSource.managed_delete("abc")
-    DataSource.managed_delete("abc_2")
-    FeatureSet.managed_delete("test_features")
-    Endpoint.managed_delete("abc")
-    Endpoint.managed_delete("abc-2")
-
-    # Delete the abalone_data Artifacts
-    DataSource.managed_delete("abalone_data")
-    DataSource.managed_delete("abalone_data_copy")
-    FeatureSet.managed_delete("abalone_features")
-    Model.managed_delete("abalone-regression")
-    Endpoint.managed_delete("abalone-regression-end")
-    Endpoint.managed_delete("abalone-regression-end-rt")
-
-    # Delete abalone_classification Artifacts
-    FeatureSet.managed_delete("abalone_classification")
-    Model.managed_delete("abalone-classification")
-    Endpoint.managed_delete("abalone-classification-end")
 
-    # Delete the wine_data Artifacts
-    DataSource.managed_delete("wine_data")
-    FeatureSet.managed_delete("wine_features")
-    Model.managed_delete("wine-classification")
-    Endpoint.managed_delete("wine-classification-end")
-
-    # AQSol Artifacts
-    DataSource.managed_delete("aqsol_data")
-    FeatureSet.managed_delete("aqsol_features")
-    Model.managed_delete("aqsol-regression")
-    Endpoint.managed_delete("aqsol-regression-end")
-    FeatureSet.managed_delete("aqsol_mol_descriptors")
-    Model.managed_delete("aqsol-mol-regression")
-    Endpoint.managed_delete("aqsol-mol-regression-end")
-
-    # AQSol Artifacts (Classification)
-    Model.managed_delete("aqsol-mol-class")
-    Endpoint.managed_delete("aqsol-mol-class-end")
-
-    # Quantile Regressors
-    Model.managed_delete("abalone-quantile-reg")
-    Endpoint.managed_delete("abalone-qr-end")
-    Model.managed_delete("aqsol-quantile-reg")
-    Endpoint.managed_delete("aqsol-qr-end")
+if __name__ == "__main__":
 
-    # Scikit Learn Models
-    Model.managed_delete("abalone-knn-reg")
-    Endpoint.managed_delete("abalone-knn-end")
-    Model.managed_delete("abalone-clusters")
-    Endpoint.managed_delete("abalone-clusters-end")
-    Model.managed_delete("wine-rfc-class")
-    Model.managed_delete("aqsol-knn-reg")
+    # Delete each group of artifacts concurrently (Endpoints -> Models -> FeatureSets -> DataSources)
+    Endpoint.managed_delete_many(TEST_ENDPOINTS)
+    Model.managed_delete_many(TEST_MODELS)
+    FeatureSet.managed_delete_many(TEST_FEATURE_SETS)
+    DataSource.managed_delete_many(TEST_DATA_SOURCES)
 
     time.sleep(5)
     print("All test artifacts should now be deleted!")
@@ -60,6 +60,16 @@ def test_dicts():
     assert return_value == value
 
 
+def test_get_many():
+    param_store = ParameterStore()
+
+    # Add a couple of parameters and get them back in one call
+    param_store.upsert("/workbench/test", "value")
+    param_store.upsert("/workbench/my_data", {"key": "str_value", "number": 42})
+    return_values = param_store.get_many(["/workbench/test", "/workbench/my_data", "/workbench/not_found"])
+    assert return_values == {"/workbench/test": "value", "/workbench/my_data": {"key": "str_value", "number": 42}}
+
+
 def test_deletion():
     param_store = ParameterStore()
     param_store.delete("/workbench/test")
@@ -102,6 +112,7 @@ if __name__ == "__main__":
     test_simple_values()
     test_lists()
     test_dicts()
+    test_get_many()
     test_deletion()
     test_4k_limit()
     test_compressed_failure()
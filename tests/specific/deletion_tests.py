@@ -8,69 +8,76 @@ from workbench.api import DataSource, FeatureSet, Model, Endpoint, ModelType
 logging.getLogger("workbench").setLevel(logging.DEBUG)
 
 
-def create_data_source():
-    test_data = TestDataGenerator()
-    df = test_data.person_data()
-    if not DataSource("abc").exists():
-        DataSource(df, name="abc")
+# Note: The create_* helpers return the artifact objects so callers reuse them (each construction hits AWS)
+def create_data_source() -> DataSource:
+    # Only generate the test data when we actually need to create the DataSource
+    ds = DataSource("abc")
+    if not ds.exists():
+        df = TestDataGenerator().person_data()
+        ds = DataSource(df, name="abc")
+    return ds
 
 
-def create_feature_set():
-    create_data_source()
+def create_feature_set() -> FeatureSet:
+    ds = create_data_source()
 
     # If the feature set doesn't exist, create it
-    if not FeatureSet("abc_features").exists():
-        DataSource("abc").to_features("abc_features", id_column="id")
+    fs = FeatureSet("abc_features")
+    if not fs.exists():
+        fs = ds.to_features("abc_features", id_column="id")
+    return fs
 
 
-def create_model():
-    create_feature_set()
+def create_model() -> Model:
+    fs = create_feature_set()
 
     # If the model doesn't exist, create it
-    if not Model("abc-regression").exists():
-        FeatureSet("abc_features").to_model(
-            name="abc-regression", model_type=ModelType.REGRESSOR, target_column="iq_score"
-        )
+    model = Model("abc-regression")
+    if not model.exists():
+        model = fs.to_model(name="abc-regression", model_type=ModelType.REGRESSOR, target_column="iq_score")
+    return model
 
 
-def create_endpoint():
-    create_model()
+def create_endpoint() -> Endpoint:
+    model = create_model()
 
     # Create some new endpoints
-    if not Endpoint("abc-end").exists():
-        Model("abc-regression").to_endpoint(name="abc-end")
+    end = Endpoint("abc-end")
+    if not end.exists():
+        end = model.to_endpoint(name="abc-end")
+    return end
 
 
 @pytest.mark.long
 def test_endpoint_deletion():
-    create_endpoint()
+    end = create_endpoint()
 
     # Now Delete the endpoint
-    Endpoint("abc-end").delete()
+    end.delete()
 
 
 @pytest.mark.long
 def test_model_deletion():
-    create_model()
+    model = create_model()
 
     # Now Delete the Model
-    Model("abc-regression").delete()
+    model.delete()
 
 
 @pytest.mark.long
 def test_feature_set_deletion():
-    create_feature_set()
+    fs = create_feature_set()
 
     # Now Delete the FeatureSet
-    FeatureSet("abc_features").delete()
+    fs.delete()
 
 
 @pytest.mark.long
 def test_data_source_deletion():
-    create_data_source()
+    ds = create_data_source()
 
     # Now Delete the DataSource
-    DataSource("abc").delete()
+    ds.delete()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 import pytest
 import logging
+from pandas.api.types import is_numeric_dtype
 
 # Workbench Imports
 from workbench.api import DataSource, FeatureSet
@@ -19,6 +20,21 @@ def test_display_view_ds():
     print(df)
 
 
+def test_pull_dataframe_unload():
+    # The UNLOAD (Parquet) pull should return the same data as the default (CSV) pull
+    fs = FeatureSet("test_features")
+    display_view = View(fs, "display")
+    csv_df = display_view.pull_dataframe()
+    unload_df = display_view.pull_dataframe(unload=True)
+    assert len(unload_df) == len(csv_df)
+    assert list(unload_df.columns) == list(csv_df.columns)
+
+    # Parquet keeps the Athena types, so just check that numeric columns stay numeric
+    for column in csv_df.columns:
+        print(f"{column}: {csv_df[column].dtype} (CSV) {unload_df[column].dtype} (UNLOAD)")
+        assert is_numeric_dtype(csv_df[column]) == is_numeric_dtype(unload_df[column])
+
+
 def test_display_view_fs():
     # Grab the display View for a FeatureSet
     fs = FeatureSet("test_features")
@@ -99,6 +115,7 @@ if __name__ == "__main__":
 
     # Run the tests
     test_display_view_ds()
+    test_pull_dataframe_unload()
     test_display_view_fs()
     test_set_computation_view_columns()
     test_training_view()